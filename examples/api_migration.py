@@ -22,11 +22,14 @@ pfs_list = client_old.get_all_pfs_prices(batch_number=1)
 if pfs_list:
     pfs = pfs_list[0]
     print(f"\nStation: {pfs.trading_name}")
-    print(f"Has 'success' field: {hasattr(pfs, 'success')}")  # True
-    print(f"Has 'message' field: {hasattr(pfs, 'message')}")  # True
-    if hasattr(pfs, 'success'):
+    # hasattr() evaluates the deprecated properties, so check each only once
+    has_success = hasattr(pfs, 'success')
+    has_message = hasattr(pfs, 'message')
+    print(f"Has 'success' field: {has_success}")  # True
+    print(f"Has 'message' field: {has_message}")  # True
+    if has_success:
         print(f"Success value: {pfs.success}")  # Always True
-    if hasattr(pfs, 'message'):
+    if has_message:
         print(f"Message value: '{pfs.message}'")  # Always empty string
 
 print("\n" + "=" * 60)
@@ -52,7 +55,7 @@ if pfs_list:
         price = pfs.fuel_prices[0]
         print(f"\nFuel: {price.fuel_type}")
         print(f"Price: £{price.price/100:.2f}")
-        if hasattr(price, 'price_change_effective_timestamp'):
+        if price.price_change_effective_timestamp:
             print(f"Effective timestamp: {price.price_change_effective_timestamp}")
 
 print("\n" + "=" * 60)
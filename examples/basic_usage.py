@@ -6,6 +6,12 @@ The response objects no longer have 'success' and 'message' fields.
 """
 from ukfuelfinder import FuelFinderClient
 
+
+def format_price(pence):
+    """Format a price in pence as pounds, allowing for missing prices."""
+    return "n/a" if pence is None else f"£{pence / 100:.2f}"
+
+
 # Initialize client without backward compatibility
 client = FuelFinderClient(
     client_id="your_client_id",
@@ -14,26 +20,28 @@ client = FuelFinderClient(
     backward_compatible=False  # Use new API format
 )
 
-# Get all PFS with fuel prices
+# Get all PFS with fuel prices, grouped by fuel type, in a single fetch
 print("Fetching all PFS with fuel prices...")
-pfs_list = client.get_all_pfs_prices()
+overview = client.get_overview()
+pfs_list = overview.pfs
 print(f"Found {len(pfs_list)} petrol filling stations\n")
 
-# Display first few stations
+# Display first few stations, formatting the report before printing it
+lines = []
 for pfs in pfs_list[:5]:
-    print(f"{pfs.trading_name} ({pfs.mft_organisation_name})")
-    print(f"Node ID: {pfs.node_id}")
+    lines.append(f"{pfs.trading_name} ({pfs.mft_organisation_name})")
+    lines.append(f"Node ID: {pfs.node_id}")
     for price in pfs.fuel_prices:
-        print(f"  {price.fuel_type}: £{price.price/100:.2f}")
+        lines.append(f"  {price.fuel_type}: {format_price(price.price)}")
         # New field: price_change_effective_timestamp
-        if hasattr(price, 'price_change_effective_timestamp') and price.price_change_effective_timestamp:
-            print(f"    Effective: {price.price_change_effective_timestamp}")
-    print()
-
-# Get all unleaded prices
-print("\nFetching unleaded prices...")
-unleaded_prices = client.get_prices_by_fuel_type("unleaded")
-print(f"Found {len(unleaded_prices)} unleaded prices")
+        if price.price_change_effective_timestamp:
+            lines.append(f"    Effective: {price.price_change_effective_timestamp}")
+    lines.append("")
+print("\n".join(lines))
+
+# Get all unleaded prices from the overview (no extra request)
+unleaded_prices = overview.by_fuel_type.get("unleaded", [])
+print(f"\nFound {len(unleaded_prices)} unleaded prices")
 
 # Get forecourt information
 print("\nFetching forecourt information...")
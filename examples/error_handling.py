@@ -1,47 +1,120 @@
 """
 Error handling example for UK Fuel Finder API
 """
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from ukfuelfinder import FuelFinderClient
 from ukfuelfinder.exceptions import (
     AuthenticationError,
+    BatchNotFoundError,
+    InvalidBatchNumberError,
     RateLimitError,
     TimeoutError,
     ServerError,
 )
 
-client = FuelFinderClient(
-    client_id="your_client_id",
-    client_secret="your_client_secret"
-)
 
-# Handle authentication errors
-try:
-    prices = client.get_all_pfs_prices()
-except AuthenticationError as e:
-    print(f"Authentication failed: {e}")
-    print("Check your credentials")
-
-# Handle rate limiting
-try:
-    for i in range(200):
-        prices = client.get_all_pfs_prices(batch_number=i)
-except RateLimitError as e:
-    print(f"Rate limit exceeded: {e}")
-    print(f"Retry after: {e.retry_after} seconds")
-
-# Handle timeouts
-try:
-    client_with_short_timeout = FuelFinderClient(
+def ingest_all(client, max_batches=200, c_min=1, c_max=8, latency_target=5.0, max_attempts=5):
+    """
+    Fetch every price batch, adapting concurrency to the server (AIMD).
+
+    Concurrency grows by 0.5 after each successful batch and halves after a
+    429/5xx or when recent requests are slower than latency_target seconds.
+    Rate-limited batches are retried after the server's Retry-After delay.
+    """
+    concurrency = float(c_min)
+    latencies = deque(maxlen=10)
+    attempts = {}
+    results = {}
+    last_batch = max_batches
+    pending = deque(range(1, max_batches + 1))
+
+    def fetch(batch):
+        start = time.monotonic()
+        records = client.get_all_pfs_prices(batch_number=batch)
+        return records, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=c_max) as pool:
+        # Once a short or missing batch is seen, pending only holds earlier retries
+        while pending:
+            wave = [pending.popleft() for _ in range(min(int(concurrency), len(pending)))]
+            futures = {pool.submit(fetch, batch): batch for batch in wave}
+            retry_after = 0
+
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    records, latency = future.result()
+                except (BatchNotFoundError, InvalidBatchNumberError):
+                    # Past the final batch; backward-compatible clients raise the latter
+                    last_batch = min(last_batch, batch - 1)
+                    continue
+                except (RateLimitError, ServerError) as e:
+                    attempts[batch] = attempts.get(batch, 0) + 1
+                    if attempts[batch] >= max_attempts:
+                        raise
+                    concurrency = max(c_min, concurrency / 2)
+                    retry_after = max(retry_after, getattr(e, "retry_after", 0))
+                    pending.appendleft(batch)
+                    continue
+
+                results[batch] = records
+                latencies.append(latency)
+                if len(records) < 500:
+                    last_batch = min(last_batch, batch)
+                if sum(latencies) / len(latencies) > latency_target:
+                    concurrency = max(c_min, concurrency / 2)
+                else:
+                    concurrency = min(c_max, concurrency + 0.5)
+
+            # Nothing exists past the final (short or missing) batch
+            pending = deque(sorted(batch for batch in pending if batch <= last_batch))
+            if retry_after:
+                time.sleep(retry_after)
+
+    return [pfs for batch in sorted(results) if batch <= last_batch for pfs in results[batch]]
+
+
+def main():
+    client = FuelFinderClient(
         client_id="your_client_id",
-        client_secret="your_client_secret",
-        timeout=1  # 1 second
+        client_secret="your_client_secret"
     )
-    prices = client_with_short_timeout.get_all_pfs_prices()
-except TimeoutError as e:
-    print(f"Request timed out: {e}")
-
-# Handle server errors
-try:
-    prices = client.get_all_pfs_prices()
-except ServerError as e:
-    print(f"Server error: {e}")
+
+    # Handle authentication errors
+    try:
+        prices = client.get_all_pfs_prices()
+    except AuthenticationError as e:
+        print(f"Authentication failed: {e}")
+        print("Check your credentials")
+
+    # Handle rate limiting by backing off instead of giving up
+    try:
+        prices = ingest_all(client)
+        print(f"Fetched {len(prices)} stations")
+    except RateLimitError as e:
+        print(f"Rate limit still exceeded after retries: {e}")
+        print(f"Retry after: {e.retry_after} seconds")
+
+    # Handle timeouts
+    try:
+        client_with_short_timeout = FuelFinderClient(
+            client_id="your_client_id",
+            client_secret="your_client_secret",
+            timeout=1  # 1 second
+        )
+        prices = client_with_short_timeout.get_all_pfs_prices()
+    except TimeoutError as e:
+        print(f"Request timed out: {e}")
+
+    # Handle server errors
+    try:
+        prices = client.get_all_pfs_prices()
+    except ServerError as e:
+        print(f"Server error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,80 +1,82 @@
 #!/usr/bin/env python3
 """Fetch all forecourt sites and save to JSON."""
-import json
 import os
 import sys
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
 from ukfuelfinder import FuelFinderClient
+from ukfuelfinder.json_utils import dumps
 from ukfuelfinder.exceptions import TimeoutError
 
+def site_to_dict(site):
+    """Convert a site to the JSON output format."""
+    location = site.location
+    return {
+        "node_id": site.node_id,
+        "trading_name": site.trading_name,
+        "organisation": site.mft_organisation_name,
+        "brand": site.brand_name,
+        "phone": site.public_phone_number,
+        "location": {
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+            "address_line_1": location.address_line_1,
+            "address_line_2": location.address_line_2,
+            "city": location.city,
+            "county": location.county,
+            "postcode": location.postcode,
+            "country": location.country,
+        } if location else None,
+        "is_motorway": site.is_motorway_service_station,
+        "is_supermarket": site.is_supermarket_service_station,
+        "fuel_types": site.fuel_types,
+        "amenities": site.amenities,
+    }
+
 def main():
-    client = FuelFinderClient(
+    with FuelFinderClient(
         client_id=os.getenv("FUEL_FINDER_CLIENT_ID"),
         client_secret=os.getenv("FUEL_FINDER_CLIENT_SECRET"),
         timeout=120,  # 2 minute timeout for slow API
-    )
-    
-    print("Fetching all forecourt sites (this may take a while)...")
-    try:
-        sites = client.get_all_pfs_info()
-    except TimeoutError as e:
-        print(f"Error: API request timed out - {e}")
-        print("The Fuel Finder API is experiencing performance issues.")
-        print("Try using fetch_fuel_prices.py instead, which uses a faster endpoint.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {e}")
-        print("The Fuel Finder API may be under maintenance.")
-        sys.exit(1)
-    
+        cache_dir="~/.cache/ukfuelfinder",  # Reuse responses between runs
+    ) as client:
+        print("Fetching all forecourt sites (this may take a while)...")
+        try:
+            sites = client.get_all_pfs_info()
+        except TimeoutError as e:
+            print(f"Error: API request timed out - {e}")
+            print("The Fuel Finder API is experiencing performance issues.")
+            print("Try using fetch_fuel_prices.py instead, which uses a faster endpoint.")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error: {e}")
+            print("The Fuel Finder API may be under maintenance.")
+            sys.exit(1)
+
     print(f"Retrieved {len(sites)} sites")
     
-    # Convert to dict format
-    data = {
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
-        "total_sites": len(sites),
-        "sites": [
-            {
-                "node_id": site.node_id,
-                "trading_name": site.trading_name,
-                "organisation": site.mft_organisation_name,
-                "brand": site.brand_name,
-                "phone": site.public_phone_number,
-                "location": {
-                    "latitude": site.location.latitude,
-                    "longitude": site.location.longitude,
-                    "address_line_1": site.location.address_line_1,
-                    "address_line_2": site.location.address_line_2,
-                    "city": site.location.city,
-                    "county": site.location.county,
-                    "postcode": site.location.postcode,
-                    "country": site.location.country,
-                },
-                "is_motorway": site.is_motorway_service_station,
-                "is_supermarket": site.is_supermarket_service_station,
-                "fuel_types": site.fuel_types,
-                "amenities": site.amenities,
-            }
-            for site in sites
-        ],
-    }
-    
-    # Save to JSON
-    filename = f"forecourt_sites_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    # Save to JSON, writing one site at a time rather than building the
+    # whole document in memory first
+    now = datetime.now(timezone.utc)
+    fetched_at = now.isoformat().replace("+00:00", "Z")
+    filename = f"forecourt_sites_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(f'{{"fetched_at": "{fetched_at}",\n')
+        f.write(f' "total_sites": {len(sites)},\n')
+        f.write(' "sites": [')
+        for i, site in enumerate(sites):
+            f.write(",\n  " if i else "\n  ")
+            f.write(dumps(site_to_dict(site)))
+        f.write("\n]}\n")
     
     print(f"Saved to {filename}")
     
     # Print summary stats
-    brands = {}
-    for site in sites:
-        brand = site.brand_name or "Unknown"
-        brands[brand] = brands.get(brand, 0) + 1
+    brands = Counter(site.brand_name or "Unknown" for site in sites)
     
-    print("\nTop 10 brands by site count:")
-    for brand, count in sorted(brands.items(), key=lambda x: x[1], reverse=True)[:10]:
-        print(f"  {brand}: {count}")
+    lines = ["\nTop 10 brands by site count:"]
+    lines.extend(f"  {brand}: {count}" for brand, count in brands.most_common(10))
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main()
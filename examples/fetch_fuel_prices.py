@@ -1,74 +1,75 @@
 #!/usr/bin/env python3
 """Fetch all fuel prices and save to JSON."""
-import json
 import os
 import sys
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
 from ukfuelfinder import FuelFinderClient
+from ukfuelfinder.json_utils import dumps
 from ukfuelfinder.exceptions import TimeoutError
 
+def pfs_to_dict(p):
+    """Convert a station's prices to the JSON output format."""
+    return {
+        "node_id": p.node_id,
+        "organisation": p.mft_organisation_name,
+        "trading_name": p.trading_name,
+        "fuel_prices": [
+            {
+                "fuel_type": fp.fuel_type,
+                "price": fp.price,
+                "last_updated": fp.price_last_updated.isoformat() + "Z" if fp.price_last_updated else None,
+            }
+            for fp in p.fuel_prices
+        ],
+    }
+
 def main():
-    client = FuelFinderClient(
+    with FuelFinderClient(
         client_id=os.getenv("FUEL_FINDER_CLIENT_ID"),
         client_secret=os.getenv("FUEL_FINDER_CLIENT_SECRET"),
         timeout=60,
-    )
-    
-    print("Fetching all fuel prices...")
-    try:
-        prices = client.get_all_pfs_prices()
-    except TimeoutError as e:
-        print(f"Error: API request timed out - {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    
+        cache_dir="~/.cache/ukfuelfinder",  # Reuse responses between runs
+    ) as client:
+        print("Fetching all fuel prices...")
+        try:
+            prices = client.get_all_pfs_prices()
+        except TimeoutError as e:
+            print(f"Error: API request timed out - {e}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
     print(f"Retrieved {len(prices)} price records")
     
-    # Convert to dict format
-    data = {
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
-        "total_records": len(prices),
-        "prices": [
-            {
-                "node_id": p.node_id,
-                "organisation": p.mft_organisation_name,
-                "trading_name": p.trading_name,
-                "fuel_prices": [
-                    {
-                        "fuel_type": fp.fuel_type,
-                        "price": fp.price,
-                        "last_updated": fp.price_last_updated.isoformat() + "Z" if fp.price_last_updated else None,
-                    }
-                    for fp in p.fuel_prices
-                ],
-            }
-            for p in prices
-        ],
-    }
-    
-    # Save to JSON
-    filename = f"fuel_prices_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    # Save to JSON, writing one record at a time rather than building the
+    # whole document in memory first
+    now = datetime.now(timezone.utc)
+    fetched_at = now.isoformat().replace("+00:00", "Z")
+    filename = f"fuel_prices_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(f'{{"fetched_at": "{fetched_at}",\n')
+        f.write(f' "total_records": {len(prices)},\n')
+        f.write(' "prices": [')
+        for i, p in enumerate(prices):
+            f.write(",\n  " if i else "\n  ")
+            f.write(dumps(pfs_to_dict(p)))
+        f.write("\n]}\n")
     
     print(f"Saved to {filename}")
     
     # Print summary stats
-    fuel_types = {}
-    total_prices = 0
-    for p in prices:
-        for fp in p.fuel_prices:
-            if fp.price:
-                fuel_types[fp.fuel_type] = fuel_types.get(fp.fuel_type, 0) + 1
-                total_prices += 1
+    fuel_types = Counter(fp.fuel_type for p in prices for fp in p.fuel_prices if fp.price)
+    total_prices = sum(fuel_types.values())
     
-    print(f"\nTotal sites with prices: {len(prices)}")
-    print(f"Total price records: {total_prices}")
-    print("\nPrices by fuel type:")
-    for fuel_type, count in sorted(fuel_types.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {fuel_type}: {count}")
+    lines = [
+        f"\nTotal sites with prices: {len(prices)}",
+        f"Total price records: {total_prices}",
+        "\nPrices by fuel type:",
+    ]
+    lines.extend(f"  {fuel_type}: {count}" for fuel_type, count in fuel_types.most_common())
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main()
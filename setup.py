@@ -41,6 +41,9 @@ setup(
             "mypy>=1.0.0",
             "flake8>=6.0.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
     },
     keywords="fuel prices uk government api petrol diesel forecourt",
 )
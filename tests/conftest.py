@@ -8,8 +8,11 @@ from dotenv import load_dotenv
 from tests.fixtures.responses import MOCK_PFS_RESPONSE, MOCK_TOKEN_RESPONSE
 from ukfuelfinder import FuelFinderClient
 
-# Load environment variables from .env file
-load_dotenv()
+
+@pytest.fixture(scope="session", autouse=True)
+def load_env():
+    """Load environment variables from .env file once per test session."""
+    load_dotenv()
 
 
 @pytest.fixture
@@ -1,5 +1,21 @@
 """Test fixtures for UK Fuel Finder API."""
 
+from types import SimpleNamespace
+
+
+def fake_response(
+    status_code, content=b"", text="", url="https://api.example.com/endpoint", headers=None
+):
+    """Build a lightweight stand-in for requests.Response."""
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        text=text,
+        url=url,
+        headers=headers or {},
+    )
+
+
 MOCK_TOKEN_RESPONSE = {
     "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test_token",
     "token_type": "Bearer",
@@ -44,29 +60,6 @@ MOCK_PFS_RESPONSE = [
     },
 ]
 
-MOCK_PFS_INFO_RESPONSE = [
-    {
-        "node_id": "0028acef5f3afc41c7e7d",
-        "mft_organisation_name": "Shell UK",
-        "trading_name": "Shell Station",
-        "public_phone_number": "01234567890",
-        "address": {
-            "line1": "123 High Street",
-            "line2": None,
-            "city": "London",
-            "county": "Greater London",
-            "postcode": "SW1A 1AA",
-        },
-        "location": {"latitude": 51.5074, "longitude": -0.1278},
-        "brand": "Shell",
-        "operator": "Shell UK",
-        "amenities": ["shop", "atm", "car_wash"],
-        "opening_hours": {"monday": "00:00-23:59"},
-    }
-]
-
-MOCK_ERROR_RESPONSE = {"error": "unauthorized", "message": "Invalid or expired access token"}
-
 # Fixtures for API responses without mft_organisation_name (Feb 25-26, 2026 changes)
 MOCK_PFS_RESPONSE_NO_MFT = [
     {
@@ -67,6 +67,6 @@ def test_murco_wool_station_has_prices():
         len(prices_with_values) > 0
     ), f"Station {murco_station.trading_name} has price records but all prices are None"
 
-    print(f"\n✅ Station has {len(prices_with_values)} prices:")
-    for fp in prices_with_values:
-        print(f"   {fp.fuel_type}: {fp.price}p")
+    lines = [f"\n✅ Station has {len(prices_with_values)} prices:"]
+    lines.extend(f"   {fp.fuel_type}: {fp.price}p" for fp in prices_with_values)
+    print("\n".join(lines))
@@ -0,0 +1,21 @@
+"""Shared fixtures for unit tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def mock_authenticator():
+    """Mock authenticator."""
+    return SimpleNamespace(get_token=lambda: "test_token")
+
+
+@pytest.fixture(scope="module")
+def mock_rate_limiter():
+    """Mock rate limiter."""
+    return SimpleNamespace(
+        acquire=lambda: None,
+        update_from_headers=lambda headers: None,
+        handle_rate_limit_error=lambda retry_after: None,
+    )
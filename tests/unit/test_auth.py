@@ -1,10 +1,12 @@
 """Unit tests for authentication module."""
 
+import threading
+
 import pytest
 import responses
 
 from ukfuelfinder.auth import OAuth2Authenticator
-from ukfuelfinder.exceptions import InvalidCredentialsError
+from ukfuelfinder.exceptions import AuthenticationError, InvalidCredentialsError
 
 
 @pytest.mark.unit
@@ -113,3 +115,65 @@ class TestOAuth2Authenticator:
         # Should refresh
         token2 = auth._refresh_access_token()
         assert token2 == "new_access_token"
+
+    @responses.activate
+    def test_nested_token_response_and_invalid_json(self, mock_token_response):
+        """Test a token wrapped in "data" is read and a non-JSON body is an auth error."""
+        url = "https://test.fuel-finder.service.gov.uk/api/v1/oauth/generate_access_token"
+        responses.add(responses.POST, url, json={"data": mock_token_response}, status=200)
+        responses.add(responses.POST, url, body="<html>Bad gateway</html>", status=200)
+
+        auth = OAuth2Authenticator(
+            client_id="test_id",
+            client_secret="test_secret",
+            token_url=url,
+            refresh_url="https://test.fuel-finder.service.gov.uk/api/v1/oauth/regenerate_access_token",
+        )
+
+        assert auth._generate_token() == mock_token_response["access_token"]
+        with pytest.raises(AuthenticationError, match="Failed to generate access token"):
+            auth._generate_token()
+
+    def test_stale_token_refreshed_in_background(self, monkeypatch):
+        """Test a token near expiry is returned while a new one is fetched."""
+        auth = OAuth2Authenticator(
+            client_id="test_id",
+            client_secret="test_secret",
+            token_url="https://test.fuel-finder.service.gov.uk/api/v1/oauth/generate_access_token",
+            refresh_url="https://test.fuel-finder.service.gov.uk/api/v1/oauth/regenerate_access_token",
+        )
+        auth._store_token({"access_token": "old_token", "expires_in": 30})
+        release = threading.Event()
+        renewed = threading.Event()
+
+        def renew():
+            release.wait(5)
+            token = auth._store_token({"access_token": "new_token", "expires_in": 3600})
+            renewed.set()
+            return token
+
+        monkeypatch.setattr(auth, "_renew", renew)
+
+        assert auth.get_token() == "old_token"
+        assert auth.get_token() == "old_token"  # No second refresh while one is in flight
+
+        release.set()
+        assert renewed.wait(5)
+        assert auth.get_token() == "new_token"
+
+    def test_expired_token_renewed_before_returning(self, monkeypatch):
+        """Test a token past the expiry margin is replaced before it is returned."""
+        auth = OAuth2Authenticator(
+            client_id="test_id",
+            client_secret="test_secret",
+            token_url="https://test.fuel-finder.service.gov.uk/api/v1/oauth/generate_access_token",
+            refresh_url="https://test.fuel-finder.service.gov.uk/api/v1/oauth/regenerate_access_token",
+        )
+        auth._store_token({"access_token": "old_token", "expires_in": 5})
+        monkeypatch.setattr(
+            auth,
+            "_renew",
+            lambda: auth._store_token({"access_token": "new_token", "expires_in": 3600}),
+        )
+
+        assert auth.get_token() == "new_token"
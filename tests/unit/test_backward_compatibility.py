@@ -5,10 +5,18 @@ import warnings
 import pytest
 
 from ukfuelfinder.client import FuelFinderClient
-from ukfuelfinder.compatibility import BackwardCompatibleResponse
+from ukfuelfinder.compatibility import BackwardCompatibleResponse, wrap_response
 from ukfuelfinder.models import PFS
 
 
+@pytest.fixture(autouse=True)
+def reset_deprecation_warnings():
+    """Let each test see the first deprecated field warning."""
+    BackwardCompatibleResponse._warned.clear()
+    yield
+    BackwardCompatibleResponse._warned.clear()
+
+
 @pytest.mark.unit
 class TestBackwardCompatibility:
     """Tests for backward compatibility features."""
@@ -28,23 +36,53 @@ class TestBackwardCompatibility:
         wrapped = BackwardCompatibleResponse(mock_pfs)
 
         # Test that wrapper provides success and message fields
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning) as w:
+            assert wrapped.success is True
+            assert wrapped.message == ""
+        assert len(w) == 2  # One warning for each deprecated field
+
+        # Further reads do not warn again
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
             assert wrapped.success is True
             assert wrapped.message == ""
-            assert len(w) == 2  # One warning for each deprecated field access
-            assert issubclass(w[0].category, DeprecationWarning)
-            assert issubclass(w[1].category, DeprecationWarning)
 
         # Test that wrapper delegates other attributes
         assert wrapped.node_id == "test123"
         assert wrapped.trading_name == "Test Station"
         assert wrapped.public_phone_number == "01234567890"
 
+        # Wrappers carry only the wrapped response
+        with pytest.raises(AttributeError):
+            object.__getattribute__(wrapped, "__dict__")
+
         # Test string representations
         assert "BackwardCompatibleResponse" in repr(wrapped)
         assert "test123" in str(wrapped)
 
+    def test_wrap_response_forwards_fields(self):
+        """Test that wrap_response builds one slotted forwarding class per model."""
+        pfs = PFS(
+            node_id="test123",
+            mft_organisation_name="Test Org",
+            trading_name="Test Station",
+            public_phone_number=None,
+            fuel_prices=[],
+        )
+
+        wrapped = wrap_response(pfs)
+
+        assert isinstance(wrapped, BackwardCompatibleResponse)
+        assert type(wrapped) is type(wrap_response(pfs))
+        assert "node_id" in vars(type(wrapped))
+        assert wrapped.node_id == "test123"
+        assert wrapped.public_phone_number is None
+        with pytest.warns(DeprecationWarning):
+            assert wrapped.success is True
+        with pytest.raises(AttributeError):
+            object.__getattribute__(wrapped, "__dict__")
+        assert "BackwardCompatibleResponse" in repr(wrapped)
+
     def test_client_backward_compatibility_default(self):
         """Test client backward compatibility defaults to True."""
         client = FuelFinderClient(
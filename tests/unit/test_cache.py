@@ -1,10 +1,11 @@
 """Unit tests for cache module."""
 
+import gzip
 import time
 
 import pytest
 
-from ukfuelfinder.cache import ResponseCache
+from ukfuelfinder.cache import DiskCache, ResponseCache
 
 
 @pytest.mark.unit
@@ -21,18 +22,48 @@ class TestResponseCache:
 
     def test_cache_expiry(self):
         """Test that cache entries expire after TTL."""
-        cache = ResponseCache()
+        clock = {"now": 1000.0}
+        cache = ResponseCache(time_func=lambda: clock["now"])
         cache.set("test_key", {"data": "value"}, ttl=1)
 
         # Should be available immediately
         assert cache.get("test_key") is not None
 
-        # Wait for expiry
-        time.sleep(1.1)
+        # Advance past expiry
+        clock["now"] += 1.1
 
         # Should be expired
         assert cache.get("test_key") is None
 
+    def test_purge_removes_only_expired_entries(self):
+        """Test that purge drops expired entries and keeps live ones."""
+        clock = {"now": 1000.0}
+        cache = ResponseCache(time_func=lambda: clock["now"])
+        cache.set("short", "value", ttl=1)
+        cache.set("long", "value", ttl=60)
+        cache.set("renewed", "old", ttl=1)
+        cache.set("renewed", "new", ttl=60)
+
+        clock["now"] += 2
+
+        assert cache.purge() == 1
+        assert cache.get_stats()["size"] == 2
+        assert cache.get("renewed") == "new"
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted past maxsize."""
+        cache = ResponseCache(maxsize=2)
+        cache.set("key1", "value1", ttl=60)
+        cache.set("key2", "value2", ttl=60)
+
+        cache.get("key1")
+        cache.set("key3", "value3", ttl=60)
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+        assert cache.get_stats()["size"] == 2
+
     def test_cache_miss(self):
         """Test cache miss returns None."""
         cache = ResponseCache()
@@ -60,6 +91,16 @@ class TestResponseCache:
         assert key1 == key2  # Same params = same key
         assert key1 != key3  # Different params = different key
 
+    def test_generate_key_from_items_matches_dict(self):
+        """Test that pre-sorted items give the same key as a params dict."""
+        cache = ResponseCache()
+        params = {"effective-start-timestamp": "2024-01-01 00:00:00", "batch-number": 2}
+
+        key = cache.generate_key_from_items("/pfs", tuple(sorted(params.items())))
+
+        assert key == cache.generate_key("/pfs", params)
+        assert cache.generate_key_from_items("/pfs", ()) == cache.generate_key("/pfs")
+
     def test_cache_stats(self):
         """Test cache statistics tracking."""
         cache = ResponseCache()
@@ -76,3 +117,76 @@ class TestResponseCache:
         assert stats["misses"] == 1
         assert stats["total"] == 2
         assert stats["size"] == 1
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    """Tests for DiskCache class."""
+
+    def test_persists_between_instances(self, tmp_path):
+        """Test that a new cache instance reads entries written by another."""
+        DiskCache(tmp_path).set("test_key", [{"node_id": "abc"}], ttl=60)
+
+        cache = DiskCache(tmp_path)
+        assert cache.get("test_key") == [{"node_id": "abc"}]
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 0
+
+    def test_generated_keys_map_to_flat_files(self, tmp_path):
+        """Test that keys containing path separators are stored under hashed names."""
+        cache = DiskCache(tmp_path)
+        key = cache.generate_key("/pfs/fuel-prices", {"batch-number": 1})
+        cache.set(key, [], ttl=60)
+
+        assert [p.parent for p in tmp_path.iterdir()] == [tmp_path]
+        assert DiskCache(tmp_path).get(key) == []
+
+    def test_expired_entry_removed(self, tmp_path, monkeypatch):
+        """Test that expired entries on disk are treated as misses and deleted."""
+        DiskCache(tmp_path).set("test_key", {"data": "value"}, ttl=60)
+        now = time.time()
+        monkeypatch.setattr("ukfuelfinder.cache.time.time", lambda: now + 61)
+
+        assert DiskCache(tmp_path).get("test_key") is None
+        assert not list(tmp_path.glob("*.json.gz"))
+
+    def test_corrupt_file_is_miss(self, tmp_path):
+        """Test that unreadable cache files are ignored."""
+        cache = DiskCache(tmp_path)
+        cache._path("test_key").write_bytes(b"not gzip")
+
+        assert cache.get("test_key") is None
+
+    @pytest.mark.parametrize(
+        "payload", [b"[1, 2]", b'{"value": 1}', b'{"expiry": "soon", "value": 1}']
+    )
+    def test_wrong_shape_entry_is_miss(self, tmp_path, payload):
+        """Test that valid gzipped JSON that is not a cache entry counts as a miss."""
+        cache = DiskCache(tmp_path)
+        cache._path("test_key").write_bytes(gzip.compress(payload))
+
+        assert cache.get("test_key") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_clear_removes_files(self, tmp_path):
+        """Test that clear empties the cache directory."""
+        cache = DiskCache(tmp_path)
+        cache.set("key1", "value1", ttl=60)
+        cache.set("key2", "value2", ttl=60)
+
+        cache.clear()
+
+        assert not list(tmp_path.glob("ukfuelfinder-*.json.gz"))
+        assert DiskCache(tmp_path).get("key1") is None
+
+    def test_clear_leaves_unrelated_files(self, tmp_path):
+        """Test that clear only deletes files DiskCache wrote."""
+        unrelated = [tmp_path / "backup.json.gz", tmp_path / "ukfuelfinder-notes.json.gz"]
+        for path in unrelated:
+            path.write_bytes(b"keep me")
+        cache = DiskCache(tmp_path)
+        cache.set("key1", "value1", ttl=60)
+
+        cache.clear()
+
+        assert sorted(tmp_path.iterdir()) == sorted(unrelated)
@@ -0,0 +1,301 @@
+"""Unit tests for client lifecycle and convenience methods."""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from ukfuelfinder.client import FuelFinderClient
+from ukfuelfinder.compatibility import BackwardCompatibleResponse
+from ukfuelfinder.models import PFS, FuelPrice, PFSInfo, index_by_node_id
+
+
+@pytest.mark.unit
+class TestClientSession:
+    """Tests for HTTP session handling."""
+
+    def test_components_share_session(self):
+        """Test that auth and HTTP requests use the same session."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+
+        assert client.http_client.session is client.session
+        assert client.authenticator.session is client.session
+
+    def test_injected_session_is_used(self):
+        """Test that a caller-provided session is used and not closed."""
+        session = Mock(spec=requests.Session)
+
+        with FuelFinderClient(client_id="test", client_secret="test", session=session) as client:
+            assert client.http_client.session is session
+
+        session.close.assert_not_called()
+
+    def test_context_manager_closes_own_session(self, monkeypatch):
+        """Test that leaving the context closes the client's own session."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        close = Mock()
+        monkeypatch.setattr(client.session, "close", close)
+
+        with client:
+            pass
+
+        close.assert_called_once_with()
+
+    def test_conditional_requests_follow_cache_enabled(self):
+        """Test that disabling caching also stops keeping bodies for conditional requests."""
+        enabled = FuelFinderClient(client_id="test", client_secret="test")
+        disabled = FuelFinderClient(client_id="test", client_secret="test", cache_enabled=False)
+
+        assert enabled.http_client._validated is not None
+        assert disabled.http_client._validated is None
+
+    def test_max_workers_configures_pagination_and_pool(self):
+        """Test that max_workers reaches the services and the connection pool."""
+        client = FuelFinderClient(client_id="test", client_secret="test", max_workers=16)
+
+        assert client.price_service.max_workers == 16
+        assert client.forecourt_service.max_workers == 16
+        assert client.session.get_adapter("https://example.com")._pool_maxsize == 16
+
+
+@pytest.mark.unit
+class TestClientOverview:
+    """Tests for get_overview."""
+
+    @pytest.fixture
+    def pfs_list(self):
+        return [
+            PFS(
+                node_id=f"site{i}",
+                mft_organisation_name="Test Org",
+                trading_name=f"Station {i}",
+                public_phone_number=None,
+                fuel_prices=[FuelPrice(fuel_type="E10", price=140.0 + i), FuelPrice("B7", None)],
+            )
+            for i in range(3)
+        ]
+
+    def test_overview_fetches_prices_once(self, pfs_list, monkeypatch):
+        """Test that the overview groups prices without further requests."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        fetch = Mock(return_value=pfs_list)
+        monkeypatch.setattr(client, "get_all_pfs_prices", fetch)
+
+        overview = client.get_overview()
+
+        fetch.assert_called_once_with()
+        assert overview.pfs is pfs_list
+        assert [p.price for p in overview.by_fuel_type["E10"]] == [140.0, 141.0, 142.0]
+        assert len(overview.by_fuel_type["B7"]) == 3
+
+    def test_overview_filters_fuel_types(self, pfs_list, monkeypatch):
+        """Test that only requested fuel types are indexed."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        monkeypatch.setattr(client, "get_all_pfs_prices", lambda: pfs_list)
+
+        overview = client.get_overview(fuel_types=["B7"])
+
+        assert list(overview.by_fuel_type) == ["B7"]
+
+
+def make_site(node_id):
+    """Build a minimal PFSInfo."""
+    return PFSInfo(
+        node_id=node_id,
+        mft_organisation_name=None,
+        trading_name="Test Station",
+        public_phone_number=None,
+    )
+
+
+@pytest.mark.unit
+class TestClientListingMemo:
+    """Tests for reuse of the full site and price listings."""
+
+    def test_full_listing_is_reused(self, monkeypatch):
+        """Test that repeat calls reuse the listing without refetching."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        fetch = Mock(return_value=iter([[make_site("site1")]]))
+        monkeypatch.setattr(client.forecourt_service, "get_all_pfs_paginated", fetch)
+
+        first = client.get_all_pfs_info()
+        second = client.get_all_pfs_info()
+
+        assert second == first
+        fetch.assert_called_once_with()
+
+    @pytest.mark.parametrize("method", ["get_all_pfs_info", "get_all_pfs_prices"])
+    def test_modifying_result_does_not_change_next_call(self, method, monkeypatch):
+        """Test that sorting or emptying a returned listing leaves the memoized one intact."""
+        client = FuelFinderClient(client_id="test", client_secret="test", backward_compatible=False)
+        sites = [make_site("site2"), make_site("site1")]
+        monkeypatch.setattr(
+            client.forecourt_service, "get_all_pfs_paginated", lambda: iter([sites])
+        )
+        monkeypatch.setattr(
+            client.price_service, "get_all_pfs_prices_paginated", lambda **kwargs: list(sites)
+        )
+
+        first = getattr(client, method)()
+        first.sort(key=lambda site: site.node_id)
+        first.append(make_site("site3"))
+        second = getattr(client, method)()
+        second.clear()
+
+        assert [site.node_id for site in getattr(client, method)()] == ["site2", "site1"]
+
+    def test_clear_cache_drops_listing(self, monkeypatch):
+        """Test that clear_cache forces the listing to be fetched again."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        fetch = Mock(side_effect=lambda: iter([[make_site("site1")]]))
+        monkeypatch.setattr(client.forecourt_service, "get_all_pfs_paginated", fetch)
+
+        first = client.get_all_pfs_info()
+        client.clear_cache()
+
+        assert client.get_all_pfs_info() is not first
+        assert fetch.call_count == 2
+
+    def test_not_reused_when_caching_disabled(self, monkeypatch):
+        """Test that the listing is fetched every time with caching disabled."""
+        client = FuelFinderClient(client_id="test", client_secret="test", cache_enabled=False)
+        fetch = Mock(side_effect=lambda: iter([[make_site("site1")]]))
+        monkeypatch.setattr(client.forecourt_service, "get_all_pfs_paginated", fetch)
+
+        client.get_all_pfs_info()
+        client.get_all_pfs_info()
+
+        assert fetch.call_count == 2
+
+    def test_price_lookups_share_one_fetch(self, monkeypatch):
+        """Test that get_pfs and get_prices_by_fuel_type reuse the price listing."""
+        client = FuelFinderClient(client_id="test", client_secret="test", backward_compatible=False)
+        pfs = PFS(
+            node_id="site1",
+            mft_organisation_name=None,
+            trading_name="Test Station",
+            public_phone_number=None,
+            fuel_prices=[FuelPrice(fuel_type="E10", price=140.0)],
+        )
+        fetch = Mock(return_value=[pfs])
+        monkeypatch.setattr(client.price_service, "get_all_pfs_prices_paginated", fetch)
+
+        assert client.get_pfs("site1") is pfs
+        assert client.get_prices_by_fuel_type("E10") == pfs.fuel_prices
+        assert client.get_all_pfs_prices(effective_start_timestamp="2026-01-01 00:00:00") == [pfs]
+
+        assert fetch.call_count == 2
+
+    def test_lookups_index_memoized_listing_once(self, monkeypatch):
+        """Test that lookups keep one index even though each get_all_pfs_info returns a copy."""
+        client = FuelFinderClient(client_id="test", client_secret="test", backward_compatible=False)
+        sites = [make_site("site1"), make_site("site2")]
+        monkeypatch.setattr(
+            client.forecourt_service, "get_all_pfs_paginated", lambda: iter([sites])
+        )
+
+        assert client.get_pfs_info("site1") is sites[0]
+        indexed = client._node_indexes["info"]
+        assert client.get_pfs_info("site2") is sites[1]
+
+        assert client._node_indexes["info"] is indexed
+        assert client.get_all_pfs_info() is not indexed[0]
+
+    def test_listing_memo_looked_up_once_per_call(self, monkeypatch):
+        """Test that each listing call does a single memo lookup."""
+        client = FuelFinderClient(client_id="test", client_secret="test", backward_compatible=False)
+        monkeypatch.setattr(
+            client.forecourt_service, "get_all_pfs_paginated", lambda: iter([[make_site("site1")]])
+        )
+
+        client.get_pfs_info("site1")
+        client.get_all_pfs_info()
+
+        stats = client._listing_memo.get_stats()
+        assert (stats["misses"], stats["hits"]) == (1, 1)
+
+    def test_node_id_lookups_reuse_index(self, monkeypatch):
+        """Test that get_pfs_info indexes the listing once and finds every site."""
+        client = FuelFinderClient(client_id="test", client_secret="test", backward_compatible=False)
+        sites = [make_site(f"site{i}") for i in range(5)]
+        monkeypatch.setattr(client, "_info_listing", lambda: sites)
+
+        assert [client.get_pfs_info(f"site{i}") for i in range(5)] == sites
+        assert client.get_pfs_info("missing") is None
+        assert client._node_indexes["info"][0] is sites
+
+
+@pytest.mark.unit
+class TestClientStreaming:
+    """Tests for streaming the site listing."""
+
+    def test_iter_all_pfs_info_streams_batches(self, monkeypatch):
+        """Test that records are yielded batch by batch and wrapped when enabled."""
+        client = FuelFinderClient(client_id="test", client_secret="test", backward_compatible=True)
+        batches = [[make_site("site1"), make_site("site2")], [make_site("site3")]]
+        monkeypatch.setattr(
+            client.forecourt_service, "get_all_pfs_paginated", lambda: iter(batches)
+        )
+
+        records = client.iter_all_pfs_info()
+        first = next(records)
+
+        assert isinstance(first, BackwardCompatibleResponse)
+        assert [first.node_id] + [r.node_id for r in records] == ["site1", "site2", "site3"]
+
+
+@pytest.mark.unit
+class TestServiceParsedCache:
+    """Tests for reuse of models parsed from cached responses."""
+
+    def test_cache_hits_reuse_parsed_models(self, monkeypatch):
+        """Test that a cached batch is parsed once and rebuilt after it is cleared."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        raw = [{"node_id": "site1", "trading_name": "Test Station"}]
+        get = Mock(side_effect=lambda *args, **kwargs: list(raw))
+        monkeypatch.setattr(client.http_client, "get", get)
+        service = client.forecourt_service
+
+        first = service.get_all_pfs(batch_number=1)
+        second = service.get_all_pfs(batch_number=1)
+        assert second is not first
+        assert second[0] is first[0]
+        assert get.call_count == 1
+
+        client.clear_cache()
+        assert service._parsed.get_stats()["size"] == 0
+        refreshed = service.get_all_pfs(batch_number=1)
+
+        assert refreshed[0] is not first[0]
+        assert refreshed == first
+        assert get.call_count == 2
+
+    def test_modifying_cached_batch_does_not_change_next_hit(self, monkeypatch):
+        """Test that editing a returned batch list leaves later cache hits intact."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        raw = [
+            {"node_id": "site2", "trading_name": "Test Station"},
+            {"node_id": "site1", "trading_name": "Test Station"},
+        ]
+        monkeypatch.setattr(client.http_client, "get", lambda *args, **kwargs: list(raw))
+        service = client.forecourt_service
+
+        first = service.get_all_pfs(batch_number=1)
+        first.sort(key=lambda site: site.node_id)
+        first.pop()
+        service.get_all_pfs(batch_number=1).clear()
+
+        assert [site.node_id for site in service.get_all_pfs(batch_number=1)] == ["site2", "site1"]
+
+    def test_node_id_lookup_accepts_index(self):
+        """Test that service lookups use a prebuilt index and keep first-match semantics."""
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        first, duplicate, other = make_site("site1"), make_site("site1"), make_site("site2")
+        sites = [first, duplicate, other]
+        index = index_by_node_id(sites)
+        service = client.forecourt_service
+
+        assert index["site1"] is first
+        assert service.get_pfs_by_node_id("site1", index) is first
+        assert service.get_pfs_by_node_id("site1", sites) is first
+        assert service.get_pfs_by_node_id("missing", index) is None
@@ -1,12 +1,19 @@
 """Unit tests for error handling."""
 
+import importlib.util
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
-from unittest.mock import Mock, patch
 import requests
 
+from tests.fixtures.responses import fake_response
 from ukfuelfinder.http_client import HTTPClient
 from ukfuelfinder.exceptions import (
     BatchNotFoundError,
+    InvalidBatchNumberError,
     NotFoundError,
     ValidationError,
     RateLimitError,
@@ -17,88 +24,51 @@ from ukfuelfinder.exceptions import (
 )
 
 
-class TestErrorHandling:
-    """Tests for error handling."""
-
-    @pytest.fixture
-    def mock_auth(self):
-        """Mock authenticator."""
-        auth = Mock()
-        auth.get_token.return_value = "test_token"
-        return auth
-
-    @pytest.fixture
-    def mock_rate_limiter(self):
-        """Mock rate limiter."""
-        limiter = Mock()
-        limiter.acquire.return_value = None
-        return limiter
-
-    @pytest.fixture
-    def http_client(self, mock_auth, mock_rate_limiter):
-        """Create HTTP client with mocked dependencies."""
-        return HTTPClient(
-            base_url="https://api.example.com",
-            authenticator=mock_auth,
-            rate_limiter=mock_rate_limiter,
-        )
+@pytest.fixture(scope="module")
+def http_client(mock_authenticator, mock_rate_limiter):
+    """Create HTTP client with mocked dependencies, shared by the module's tests."""
+    return HTTPClient(
+        base_url="https://api.example.com",
+        authenticator=mock_authenticator,
+        rate_limiter=mock_rate_limiter,
+    )
+
+
+class TestHTTPErrorHandling:
+    """Tests for mapping HTTP failures to exceptions."""
 
     def test_batch_not_found_error_on_404(self, http_client):
         """Test BatchNotFoundError is raised for 404 on batch endpoints."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_response.url = "https://api.example.com/fuel-prices/123"
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(404, url="https://api.example.com/fuel-prices/123")
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(BatchNotFoundError, match="Batch not found"):
                 http_client.get("/fuel-prices/123")
 
     def test_not_found_error_on_404_non_batch(self, http_client):
         """Test NotFoundError is raised for 404 on non-batch endpoints."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_response.url = "https://api.example.com/other/endpoint"
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(404, url="https://api.example.com/other/endpoint")
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(NotFoundError, match="Resource not found"):
                 http_client.get("/other/endpoint")
 
     def test_validation_error_on_400(self, http_client):
         """Test ValidationError is raised for 400 responses."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 400
-            mock_response.text = "Invalid parameters"
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(400, text="Invalid parameters")
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(ValidationError, match="Invalid request"):
                 http_client.get("/endpoint")
 
     def test_validation_error_on_401(self, http_client):
         """Test ValidationError is raised for 401 responses."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 401
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(401)
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(ValidationError, match="Unauthorized"):
                 http_client.get("/endpoint")
 
     def test_rate_limit_error_on_429(self, http_client):
         """Test RateLimitError is raised for 429 responses."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 429
-            mock_response.headers = {"Retry-After": "60"}
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(429, headers={"Retry-After": "60"})
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(RateLimitError) as exc_info:
                 http_client.get("/endpoint")
 
@@ -106,25 +76,15 @@ class TestErrorHandling:
 
     def test_server_error_on_500(self, http_client):
         """Test ServerError is raised for 500 responses."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal server error"
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(500, text="Internal server error")
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(ServerError, match="Server error: 500"):
                 http_client.get("/endpoint")
 
     def test_response_parse_error_on_invalid_json(self, http_client):
         """Test ResponseParseError is raised for invalid JSON."""
-        with patch.object(http_client.session, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.side_effect = ValueError("Invalid JSON")
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            mock_request.return_value = mock_response
-
+        response = fake_response(200, content=b"<html>Invalid JSON</html>")
+        with patch.object(http_client.session, "request", return_value=response):
             with pytest.raises(ResponseParseError, match="Failed to parse JSON"):
                 http_client.get("/endpoint")
 
@@ -144,7 +104,70 @@ class TestErrorHandling:
             with pytest.raises(ConnectionError, match="Connection.*failed"):
                 http_client.get("/endpoint")
 
+
+class TestExceptionSemantics:
+    """Tests for the exception classes themselves."""
+
     def test_error_inheritance(self):
         """Test error class inheritance."""
         assert issubclass(BatchNotFoundError, NotFoundError)
         assert issubclass(NotFoundError, Exception)
+
+    @pytest.mark.parametrize(
+        "exc_cls,msg,contains",
+        [
+            (BatchNotFoundError, "Batch 999 not found", ["Batch 999", "not found"]),
+            (
+                BatchNotFoundError,
+                "Batch 123 not found: https://api.example.com/fuel-prices/batch/123",
+                ["Batch 123", "not found"],
+            ),
+            (InvalidBatchNumberError, "Invalid batch number: 999", ["Invalid", "999"]),
+        ],
+    )
+    def test_exception_messages(self, exc_cls, msg, contains):
+        """Test batch exceptions preserve their message."""
+        error = exc_cls(msg)
+        assert isinstance(error, exc_cls)
+        assert str(error) == msg
+        for text in contains:
+            assert text in str(error)
+
+
+def load_error_handling_example():
+    """Import examples/error_handling.py without running its demo."""
+    path = Path(__file__).resolve().parents[2] / "examples" / "error_handling.py"
+    spec = importlib.util.spec_from_file_location("error_handling_example", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+class TestIngestAllExample:
+    """Tests for the adaptive ingest loop in the error handling example."""
+
+    @pytest.mark.parametrize("error_cls", [InvalidBatchNumberError, BatchNotFoundError])
+    def test_stops_at_end_of_data(self, error_cls):
+        """Test that requests past the final batch end ingestion instead of raising."""
+        requested = []
+        lock = threading.Lock()
+
+        def get_all_pfs_prices(batch_number):
+            with lock:
+                requested.append(batch_number)
+            if batch_number > 3:
+                raise error_cls(f"Invalid batch number: {batch_number}")
+            size = 500 if batch_number < 3 else 120
+            return [(batch_number, i) for i in range(size)]
+
+        client = SimpleNamespace(get_all_pfs_prices=get_all_pfs_prices)
+        example = load_error_handling_example()
+
+        records = example.ingest_all(client, c_max=4)
+
+        assert len(records) == 1120
+        assert records[0] == (1, 0) and records[-1] == (3, 119)
+        # Only the wave that found the end may reach past it
+        assert max(requested) <= 3 + 4
+        assert len(requested) == len(set(requested))
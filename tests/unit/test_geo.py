@@ -0,0 +1,73 @@
+"""Unit tests for geographic search."""
+
+import random
+
+import pytest
+
+from ukfuelfinder.client import FuelFinderClient
+from ukfuelfinder.compatibility import BackwardCompatibleResponse
+from ukfuelfinder.geo import GeoIndex, haversine
+from ukfuelfinder.models import Location, PFSInfo
+
+
+def make_sites(center, count=500, seed=0):
+    """Build sites scattered around a center point."""
+    rng = random.Random(seed)
+    lat, lon = center
+    return [
+        PFSInfo(
+            node_id=f"site{i}",
+            mft_organisation_name="Test Org",
+            trading_name="Station",
+            public_phone_number="123",
+            location=Location(
+                latitude=lat + rng.uniform(-2, 2),
+                longitude=lon + rng.uniform(-3, 3),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestGeoIndex:
+    """Tests for GeoIndex class."""
+
+    @pytest.mark.parametrize("radius_km", [1.0, 25.0, 150.0, 2000.0])
+    @pytest.mark.parametrize("cell_degrees", [0.05, 0.1, 1.0])
+    def test_search_matches_full_scan(self, radius_km, cell_degrees):
+        """Test that grid searches return exactly the sites within the radius."""
+        lat, lon = 53.4, -2.2
+        sites = make_sites((lat, lon))
+        index = GeoIndex(sites, cell_degrees=cell_degrees)
+
+        results = index.search(lat, lon, radius_km)
+
+        expected = sorted(
+            site.node_id
+            for site in sites
+            if haversine(lon, lat, site.location.longitude, site.location.latitude) <= radius_km
+        )
+        assert sorted(site.node_id for _, site in results) == expected
+        assert [d for d, _ in results] == sorted(d for d, _ in results)
+
+    def test_returns_wrapped_sites(self):
+        """Test that BackwardCompatibleResponse sites are indexed and returned as given."""
+        sites = [BackwardCompatibleResponse(site) for site in make_sites((51.5, -0.1), 20)]
+
+        results = GeoIndex(sites).search(51.5, -0.1, radius_km=500)
+
+        assert len(results) == 20
+        assert all(isinstance(site, BackwardCompatibleResponse) for _, site in results)
+
+    def test_client_reuses_index_for_same_sites(self, monkeypatch):
+        """Test that search_by_location only rebuilds the index for new site lists."""
+        sites = make_sites((51.5, -0.1), 50)
+        client = FuelFinderClient(client_id="test", client_secret="test")
+        monkeypatch.setattr(client, "_info_listing", lambda: sites)
+
+        client.search_by_location(51.5, -0.1)
+        index = client._geo_index
+        client.search_by_location(51.6, -0.2)
+
+        assert client._geo_index is index
@@ -79,3 +79,18 @@ def test_default_parameter_value():
     client = FuelFinderClient(client_id="test", client_secret="test")
 
     assert client.backward_compatible is True
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1", True), ("TRUE", True), ("yes", True), ("0", False), ("off", False)],
+)
+def test_resolve_backward_compatible_env_values(value, expected):
+    """Test env var parsing, re-reading the variable on each call."""
+    from ukfuelfinder.config import resolve_backward_compatible
+
+    os.environ["UKFUELFINDER_BACKWARD_COMPATIBLE"] = value
+    assert resolve_backward_compatible(not expected) is expected
+
+    del os.environ["UKFUELFINDER_BACKWARD_COMPATIBLE"]
+    assert resolve_backward_compatible(not expected) is (not expected)
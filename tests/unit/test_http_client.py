@@ -1,8 +1,12 @@
 """Tests for HTTP client."""
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
-from unittest.mock import Mock, patch
-from ukfuelfinder.http_client import HTTPClient
+
+from tests.fixtures.responses import fake_response
+from ukfuelfinder.http_client import HTTPClient, create_session
 from ukfuelfinder.exceptions import (
     BatchNotFoundError,
     NotFoundError,
@@ -13,21 +17,7 @@ from ukfuelfinder.exceptions import (
 )
 
 
-@pytest.fixture
-def mock_authenticator():
-    auth = Mock()
-    auth.get_token.return_value = "test_token"
-    return auth
-
-
-@pytest.fixture
-def mock_rate_limiter():
-    limiter = Mock()
-    limiter.acquire.return_value = None
-    return limiter
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def http_client(mock_authenticator, mock_rate_limiter):
     return HTTPClient(
         base_url="https://api.test.com",
@@ -39,103 +29,74 @@ def http_client(mock_authenticator, mock_rate_limiter):
 
 def test_successful_request_with_data_wrapper(http_client):
     """Test successful request with new API format (data wrapper)."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": [{"id": 1}]}
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(200, content=b'{"data": [{"id": 1}]}')
+    with patch.object(http_client.session, "request", return_value=response):
         result = http_client.get("/test")
         assert result == [{"id": 1}]
 
 
 def test_successful_request_without_wrapper(http_client):
     """Test successful request with direct data (no wrapper)."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"id": 1}]
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(200, content=b'[{"id": 1}]')
+    with patch.object(http_client.session, "request", return_value=response):
         result = http_client.get("/test")
         assert result == [{"id": 1}]
 
 
 def test_successful_request_old_format(http_client):
     """Test successful request with old API format (success/message fields)."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "message": "", "data": [{"id": 1}]}
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(200, content=b'{"success": true, "message": "", "data": [{"id": 1}]}')
+    with patch.object(http_client.session, "request", return_value=response):
         result = http_client.get("/test")
         assert result == [{"id": 1}]
 
 
-def test_batch_not_found_error(http_client):
+@pytest.mark.parametrize("endpoint", ["/pfs", "/pfs/fuel-prices", "/fuel-prices/999"])
+def test_batch_not_found_error(http_client, endpoint):
     """Test 404 on batch endpoint raises BatchNotFoundError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.url = "https://api.test.com/fuel-prices/999"
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(404, url=f"https://proxy.test.com/rewritten?endpoint={endpoint}")
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(BatchNotFoundError):
-            http_client.get("/fuel-prices/999")
+            http_client.get(endpoint, params={"batch-number": 9})
+
+
+def test_not_found_classified_from_endpoint(http_client):
+    """Test that a batch-looking response URL does not make other endpoints batch errors."""
+    response = fake_response(404, url="https://proxy.test.com/pfs/other")
+    with patch.object(http_client.session, "request", return_value=response):
+        with pytest.raises(NotFoundError) as exc_info:
+            http_client.get("/other")
+    assert not isinstance(exc_info.value, BatchNotFoundError)
 
 
 def test_not_found_error(http_client):
     """Test 404 on non-batch endpoint raises NotFoundError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.url = "https://api.test.com/other"
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(404, url="https://api.test.com/other")
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(NotFoundError):
             http_client.get("/other")
 
 
 def test_validation_error_400(http_client):
     """Test 400 status raises ValidationError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad request"
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(400, text="Bad request")
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(ValidationError):
             http_client.get("/test")
 
 
 def test_validation_error_401(http_client):
     """Test 401 status raises ValidationError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(401)
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(ValidationError):
             http_client.get("/test")
 
 
 def test_rate_limit_error(http_client):
     """Test 429 status raises RateLimitError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "60"}
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(429, headers={"Retry-After": "60"})
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(RateLimitError) as exc_info:
             http_client.get("/test")
         assert exc_info.value.retry_after == 60
@@ -143,25 +104,78 @@ def test_rate_limit_error(http_client):
 
 def test_server_error(http_client):
     """Test 500 status raises ServerError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal server error"
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(500, text="Internal server error")
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(ServerError):
             http_client.get("/test")
 
 
 def test_response_parse_error(http_client):
     """Test invalid JSON raises ResponseParseError."""
-    with patch.object(http_client.session, "request") as mock_request:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_response.elapsed.total_seconds.return_value = 0.5
-        mock_request.return_value = mock_response
-
+    response = fake_response(200, content=b"<html>Invalid JSON</html>")
+    with patch.object(http_client.session, "request", return_value=response):
         with pytest.raises(ResponseParseError):
             http_client.get("/test")
+
+
+def test_create_session_mounts_pooled_adapter():
+    """Test that created sessions mount a sized connection pool."""
+    session = create_session(pool_maxsize=16)
+
+    adapter = session.get_adapter("https://api.test.com")
+    assert adapter._pool_maxsize == 16
+    assert session.headers["Accept"] == "application/json"
+
+
+def test_auth_header_rebuilt_only_on_token_change(mock_rate_limiter):
+    """Test that the Authorization header is reused until the token rotates."""
+    tokens = iter(["first", "first", "second"])
+    client = HTTPClient(
+        base_url="https://api.test.com",
+        authenticator=SimpleNamespace(get_token=lambda: next(tokens)),
+        rate_limiter=mock_rate_limiter,
+    )
+
+    first = client._auth_headers()
+    assert client._auth_headers() is first
+    assert first == {"Authorization": "Bearer first"}
+    assert client._auth_headers() == {"Authorization": "Bearer second"}
+
+
+def test_conditional_get_reuses_body_on_304(mock_rate_limiter, mock_authenticator):
+    """Test that an ETag is sent back and a 304 returns the previously decoded body."""
+    client = HTTPClient(
+        base_url="https://api.test.com",
+        authenticator=mock_authenticator,
+        rate_limiter=mock_rate_limiter,
+    )
+    responses = [
+        fake_response(200, content=b'{"data": [{"id": 1}]}', headers={"ETag": '"v1"'}),
+        fake_response(304),
+    ]
+    with patch.object(client.session, "request", side_effect=responses) as request:
+        first = client.get("/pfs", params={"batch-number": 1}, validator_ttl=60)
+        second = client.get("/pfs", params={"batch-number": 1}, validator_ttl=60)
+
+    assert second is first
+    assert "If-None-Match" not in request.call_args_list[0].kwargs["headers"]
+    assert request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize("conditional_requests, validator_ttl", [(True, None), (False, 60)])
+def test_conditional_get_disabled(
+    mock_rate_limiter, mock_authenticator, conditional_requests, validator_ttl
+):
+    """Test that no body is kept without a validator TTL or with conditional requests off."""
+    client = HTTPClient(
+        base_url="https://api.test.com",
+        authenticator=mock_authenticator,
+        rate_limiter=mock_rate_limiter,
+        conditional_requests=conditional_requests,
+    )
+    response = fake_response(200, content=b'{"data": []}', headers={"ETag": '"v1"'})
+    with patch.object(client.session, "request", return_value=response) as request:
+        client.get("/pfs", validator_ttl=validator_ttl)
+        client.get("/pfs", validator_ttl=validator_ttl)
+
+    assert "If-None-Match" not in request.call_args_list[1].kwargs["headers"]
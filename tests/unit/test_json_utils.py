@@ -0,0 +1,38 @@
+"""Unit tests for JSON helpers."""
+
+import pytest
+
+from ukfuelfinder import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+@pytest.mark.unit
+class TestJsonUtils:
+    """Tests for loads and dumps."""
+
+    def test_round_trip(self, backend):
+        """Test encoding and decoding nested payloads."""
+        payload = {"node_id": "abc", "fuel_prices": [{"fuel_type": "E10", "price": 141.9}]}
+
+        encoded = json_utils.dumps(payload)
+
+        assert isinstance(encoded, str)
+        assert json_utils.loads(encoded.encode()) == payload
+
+    def test_non_ascii_is_not_escaped(self, backend):
+        """Test that both backends emit non-ASCII characters unescaped."""
+        assert json_utils.dumps({"city": "Ynys Môn"}) == '{"city":"Ynys Môn"}'
+
+    def test_invalid_json_raises_value_error(self, backend):
+        """Test that invalid documents raise ValueError."""
+        with pytest.raises(ValueError):
+            json_utils.loads(b"<html>")
@@ -1,11 +1,35 @@
 """Unit tests for location search."""
 
+import random
+
 import pytest
 
 from ukfuelfinder.client import FuelFinderClient
 from ukfuelfinder.models import Location, PFSInfo
 
 
+@pytest.fixture(scope="module")
+def mock_sites():
+    """Sites around London and Birmingham, including some without coordinates."""
+
+    def site(node_id, location):
+        return PFSInfo(
+            node_id=node_id,
+            mft_organisation_name="Test Org",
+            trading_name=f"Station {node_id}",
+            public_phone_number="123",
+            location=location,
+        )
+
+    return [
+        site("site1", Location(latitude=51.5074, longitude=-0.1278, postcode="SW1A 1AA")),
+        site("site2", Location(latitude=51.5174, longitude=-0.1378, postcode="SW1A 2BB")),
+        site("site3", Location(latitude=52.0, longitude=-1.0, postcode="B1 1AA")),
+        site("site4", None),  # No location
+        site("site5", Location(latitude=None, longitude=-0.1278)),  # Missing latitude
+    ]
+
+
 @pytest.mark.unit
 class TestLocationSearch:
     """Tests for location search functionality."""
@@ -20,115 +44,61 @@ class TestLocationSearch:
 
         assert 340 < distance < 350  # Approximate distance
 
-    def test_search_by_location(self, monkeypatch):
-        """Test search by location."""
-        # Mock get_all_pfs_info
-        mock_sites = [
-            PFSInfo(
-                node_id="site1",
-                mft_organisation_name="Test Org 1",
-                trading_name="Station 1",
-                public_phone_number="123",
-                location=Location(
-                    latitude=51.5074,
-                    longitude=-0.1278,
-                    address_line_1="123 Street",
-                    postcode="SW1A 1AA",
-                ),
-            ),
-            PFSInfo(
-                node_id="site2",
-                mft_organisation_name="Test Org 2",
-                trading_name="Station 2",
-                public_phone_number="456",
-                location=Location(
-                    latitude=51.5174,
-                    longitude=-0.1378,
-                    address_line_1="456 Street",
-                    postcode="SW1A 2BB",
-                ),
-            ),
-            PFSInfo(
-                node_id="site3",
-                mft_organisation_name="Test Org 3",
-                trading_name="Station 3",
-                public_phone_number="789",
-                location=Location(
-                    latitude=52.0,
-                    longitude=-1.0,
-                    address_line_1="789 Street",
-                    postcode="B1 1AA",
-                ),
-            ),
-        ]
-
+    @pytest.mark.parametrize(
+        "latitude, longitude, radius_km, expected_ids",
+        [
+            # Near London: first two stations within 5km, closest first
+            (51.5074, -0.1278, 5.0, ["site1", "site2"]),
+            # Far from every station
+            (53.0, -3.0, 1.0, []),
+            # Only the Birmingham station
+            (52.0, -1.0, 1.0, ["site3"]),
+        ],
+    )
+    def test_search_by_location(
+        self, mock_sites, monkeypatch, latitude, longitude, radius_km, expected_ids
+    ):
+        """Test search by location, skipping sites without coordinates."""
         client = FuelFinderClient(client_id="test", client_secret="test")
-        monkeypatch.setattr(client, "get_all_pfs_info", lambda: mock_sites)
+        monkeypatch.setattr(client, "_info_listing", lambda: mock_sites)
 
-        # Search near London
-        results = client.search_by_location(51.5074, -0.1278, radius_km=5.0)
-
-        # Should find first two stations (within 5km), not the third
-        assert len(results) == 2
-        assert results[0][1].node_id == "site1"  # Closest
-        assert results[1][1].node_id == "site2"
+        results = client.search_by_location(latitude, longitude, radius_km=radius_km)
 
+        assert [site.node_id for _, site in results] == expected_ids
         # Results should be sorted by distance
-        assert results[0][0] < results[1][0]
+        assert [d for d, _ in results] == sorted(d for d, _ in results)
 
-    def test_search_by_location_no_results(self, monkeypatch):
-        """Test search with no results."""
+    @pytest.mark.parametrize("center", [(51.5074, -0.1278), (60.8, -0.9), (-33.9, 151.2)])
+    def test_bounding_box_matches_full_scan(self, monkeypatch, center):
+        """Test that the bounding-box prefilter never drops a site within the radius."""
+        rng = random.Random(0)
+        lat, lon = center
         mock_sites = [
             PFSInfo(
-                node_id="site1",
+                node_id=f"site{i}",
                 mft_organisation_name="Test Org",
                 trading_name="Station",
                 public_phone_number="123",
                 location=Location(
-                    latitude=52.0,
-                    longitude=-1.0,
-                    address_line_1="123 Street",
-                    postcode="B1 1AA",
+                    latitude=lat + rng.uniform(-0.5, 0.5),
+                    longitude=lon + rng.uniform(-0.8, 0.8),
                 ),
-            ),
+            )
+            for i in range(500)
         ]
 
         client = FuelFinderClient(client_id="test", client_secret="test")
-        monkeypatch.setattr(client, "get_all_pfs_info", lambda: mock_sites)
-
-        # Search far from the station
-        results = client.search_by_location(51.5074, -0.1278, radius_km=1.0)
-
-        assert len(results) == 0
-
-    def test_search_by_location_missing_coordinates(self, monkeypatch):
-        """Test search with sites missing coordinates."""
-        mock_sites = [
-            PFSInfo(
-                node_id="site1",
-                mft_organisation_name="Test Org",
-                trading_name="Station",
-                public_phone_number="123",
-                location=None,  # No location
-            ),
-            PFSInfo(
-                node_id="site2",
-                mft_organisation_name="Test Org 2",
-                trading_name="Station 2",
-                public_phone_number="456",
-                location=Location(
-                    latitude=None,  # Missing latitude
-                    longitude=-0.1278,
-                    address_line_1="123 Street",
-                    postcode="SW1A 1AA",
-                ),
-            ),
-        ]
-
-        client = FuelFinderClient(client_id="test", client_secret="test")
-        monkeypatch.setattr(client, "get_all_pfs_info", lambda: mock_sites)
-
-        # Should not crash, just return empty results
-        results = client.search_by_location(51.5074, -0.1278, radius_km=5.0)
-
-        assert len(results) == 0
+        monkeypatch.setattr(client, "_info_listing", lambda: mock_sites)
+
+        results = client.search_by_location(lat, lon, radius_km=25.0)
+
+        expected = {
+            site.node_id
+            for site in mock_sites
+            if FuelFinderClient._haversine(
+                lon, lat, site.location.longitude, site.location.latitude
+            )
+            <= 25.0
+        }
+        assert expected
+        assert {site.node_id for _, site in results} == expected
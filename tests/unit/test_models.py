@@ -1,5 +1,6 @@
 """Unit tests for models module."""
 
+import sys
 from datetime import datetime
 
 import pytest
@@ -28,16 +29,58 @@ class TestModels:
         assert isinstance(price.price_change_effective_timestamp, datetime)
         assert price.price_change_effective_timestamp.year == 2025
 
-    def test_fuel_price_rejects_deprecated_fields(self):
-        """Test FuelPrice rejects deprecated fields."""
+    def test_fuel_price_timestamps_parsed_once(self):
+        """Test that repeated timestamp strings reuse the parsed datetime."""
         data = {
             "fuel_type": "E10",
             "price": "142.9000",
-            "success": True,
+            "price_last_updated": "2026-02-02T18:00:00",
         }
 
-        with pytest.raises(ValueError, match="deprecated fields: success"):
-            FuelPrice.from_dict(data)
+        first = FuelPrice.from_dict(data)
+        second = FuelPrice.from_dict(dict(data, fuel_type="B7"))
+
+        assert first.price_last_updated == datetime(2026, 2, 2, 18, 0)
+        assert second.price_last_updated is first.price_last_updated
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2026-02-02 18:00:00", datetime(2026, 2, 2, 18, 0)),
+            ("2026-02-02T18:00:00.5", datetime(2026, 2, 2, 18, 0, 0, 500000)),
+            ("02 Feb 2026 18:00", datetime(2026, 2, 2, 18, 0)),
+        ],
+    )
+    def test_fuel_price_timestamp_formats(self, value, expected):
+        """Test that ISO and non-ISO timestamps both parse."""
+        price = FuelPrice.from_dict({"fuel_type": "E10", "price_last_updated": value})
+
+        assert price.price_last_updated == expected
+
+    def test_low_cardinality_strings_interned(self):
+        """Test that repeated fuel types and brand names share one string object."""
+        first = FuelPrice.from_dict({"fuel_type": "".join(["E", "10"])})
+        second = FuelPrice.from_dict({"fuel_type": "".join(["E", "1", "0"])})
+        assert first.fuel_type is second.fuel_type
+
+        sites = PFSInfo.from_list(
+            {"node_id": node_id, "trading_name": "Station", "brand_name": "".join(["BR", "AND"])}
+            for node_id in ("a", "b")
+        )
+        assert sites[0].brand_name is sites[1].brand_name
+
+    def test_interning_passes_through_null_and_non_strings(self):
+        """Test that null or non-string values in interned fields are kept as-is."""
+        price = FuelPrice.from_dict({"fuel_type": None, "price": "142.9000"})
+        address = Address.from_dict(
+            {"address_line_1": "1 High St", "city": None, "country": 44, "postcode": "AB1 2CD"}
+        )
+        site = PFSInfo.from_dict({"node_id": "a", "trading_name": "Station", "brand_name": 7})
+
+        assert price.fuel_type is None
+        assert address.city is None
+        assert address.country == 44
+        assert site.brand_name == 7
 
     def test_pfs_from_dict(self, mock_pfs_response):
         """Test PFS creation from dictionary."""
@@ -49,19 +92,9 @@ class TestModels:
         assert len(pfs.fuel_prices) == 2
         assert pfs.fuel_prices[0].fuel_type == "unleaded"
 
-    def test_pfs_rejects_deprecated_fields(self):
-        """Test PFS rejects deprecated fields."""
-        data = {
-            "node_id": "test123",
-            "mft_organisation_name": "Test Org",
-            "trading_name": "Test Station",
-            "public_phone_number": None,
-            "fuel_prices": [],
-            "message": "Some message",
-        }
-
-        with pytest.raises(ValueError, match="deprecated fields: message"):
-            PFS.from_dict(data)
+    def test_pfs_from_list(self, mock_pfs_response):
+        """Test bulk PFS creation matches per-record creation."""
+        assert PFS.from_list(mock_pfs_response) == [PFS.from_dict(d) for d in mock_pfs_response]
 
     def test_location_from_dict(self):
         """Test Location creation from dictionary."""
@@ -80,32 +113,57 @@ class TestModels:
         assert location.longitude == -0.1278
         assert location.address_line_1 == "123 High Street"
 
-    def test_location_rejects_deprecated_fields(self):
-        """Test Location rejects deprecated fields."""
-        data = {
-            "latitude": "51.5074",
-            "longitude": "-0.1278",
-            "success": True,
-            "message": "OK",
-        }
-
-        with pytest.raises(ValueError, match="deprecated fields"):
-            Location.from_dict(data)
-
-    def test_address_rejects_deprecated_fields(self):
-        """Test Address rejects deprecated fields."""
-        data = {
-            "address_line_1": "123 Street",
-            "address_line_2": None,
-            "city": "London",
-            "country": "England",
-            "county": None,
-            "postcode": "SW1A 1AA",
-            "success": True,
-        }
-
-        with pytest.raises(ValueError, match="deprecated fields: success"):
-            Address.from_dict(data)
+    @pytest.mark.parametrize(
+        "model_cls,base_data",
+        [
+            (FuelPrice, {"fuel_type": "E10", "price": "142.9000"}),
+            (
+                PFS,
+                {
+                    "node_id": "test123",
+                    "mft_organisation_name": "Test Org",
+                    "trading_name": "Test Station",
+                    "public_phone_number": None,
+                    "fuel_prices": [],
+                },
+            ),
+            (Location, {"latitude": "51.5074", "longitude": "-0.1278"}),
+            (
+                Address,
+                {
+                    "address_line_1": "123 Street",
+                    "address_line_2": None,
+                    "city": "London",
+                    "country": "England",
+                    "county": None,
+                    "postcode": "SW1A 1AA",
+                },
+            ),
+            (
+                PFSInfo,
+                {
+                    "node_id": "test123",
+                    "mft_organisation_name": "Test Org",
+                    "trading_name": "Test Station",
+                    "public_phone_number": None,
+                },
+            ),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "bad_fields,message",
+        [
+            (["success"], "deprecated fields: success"),
+            (["message"], "deprecated fields: message"),
+            (["success", "message"], "deprecated fields: message, success"),
+        ],
+    )
+    def test_model_rejects_deprecated_fields(self, model_cls, base_data, bad_fields, message):
+        """Test every model rejects the deprecated success and message fields."""
+        data = dict(base_data, **{field: True for field in bad_fields})
+
+        with pytest.raises(ValueError, match=message):
+            model_cls.from_dict(data)
 
     def test_pfs_info_from_dict(self):
         """Test PFSInfo creation from dictionary."""
@@ -136,77 +194,37 @@ class TestModels:
         assert "shop" in pfs_info.amenities
         assert "E10" in pfs_info.fuel_types
 
-    def test_pfs_info_rejects_deprecated_fields(self):
-        """Test PFSInfo rejects deprecated fields."""
-        data = {
-            "node_id": "test123",
-            "mft_organisation_name": "Test Org",
-            "trading_name": "Test Station",
-            "public_phone_number": None,
-            "success": True,
-        }
-
-        with pytest.raises(ValueError, match="deprecated fields: success"):
-            PFSInfo.from_dict(data)
-
-    def test_pfs_without_mft_organisation_name(self):
-        """Test PFS creation without mft_organisation_name field."""
+    @pytest.mark.parametrize("model_cls", [PFS, PFSInfo])
+    @pytest.mark.parametrize("organisation", [None, "Test Org"])
+    def test_mft_organisation_name_optional(self, model_cls, organisation):
+        """Test PFS and PFSInfo creation with and without mft_organisation_name."""
         data = {
             "node_id": "test123",
             "trading_name": "Test Station",
             "public_phone_number": None,
             "fuel_prices": [],
-        }
-
-        pfs = PFS.from_dict(data)
-
-        assert pfs.node_id == "test123"
-        assert pfs.mft_organisation_name is None
-        assert pfs.trading_name == "Test Station"
-
-    def test_pfs_with_mft_organisation_name(self):
-        """Test PFS creation with mft_organisation_name field."""
-        data = {
-            "node_id": "test123",
-            "mft_organisation_name": "Test Org",
-            "trading_name": "Test Station",
-            "public_phone_number": None,
-            "fuel_prices": [],
-        }
-
-        pfs = PFS.from_dict(data)
-
-        assert pfs.node_id == "test123"
-        assert pfs.mft_organisation_name == "Test Org"
-        assert pfs.trading_name == "Test Station"
-
-    def test_pfsinfo_without_mft_organisation_name(self):
-        """Test PFSInfo creation without mft_organisation_name field."""
-        data = {
-            "node_id": "test123",
-            "trading_name": "Test Station",
-            "public_phone_number": "01234567890",
             "location": {"latitude": "51.5", "longitude": "-0.1"},
         }
-
-        pfs_info = PFSInfo.from_dict(data)
-
-        assert pfs_info.node_id == "test123"
-        assert pfs_info.mft_organisation_name is None
-        assert pfs_info.trading_name == "Test Station"
-
-    def test_pfsinfo_with_mft_organisation_name(self):
-        """Test PFSInfo creation with mft_organisation_name field."""
-        data = {
-            "node_id": "test123",
-            "mft_organisation_name": "Test Org",
-            "trading_name": "Test Station",
-            "public_phone_number": "01234567890",
-            "location": {"latitude": "51.5", "longitude": "-0.1"},
-        }
-
-        pfs_info = PFSInfo.from_dict(data)
-
-        assert pfs_info.node_id == "test123"
-        assert pfs_info.mft_organisation_name == "Test Org"
-        assert pfs_info.trading_name == "Test Station"
+        if organisation is not None:
+            data["mft_organisation_name"] = organisation
+
+        station = model_cls.from_dict(data)
+
+        assert station.node_id == "test123"
+        assert station.mft_organisation_name == organisation
+        assert station.trading_name == "Test Station"
+
+    def test_models_use_slots(self):
+        """Test that models are slotted on Python 3.10+ and keep __dict__ before."""
+        location = Location(latitude=51.5, longitude=-0.1)
+        price = FuelPrice(fuel_type="E10", price=142.9)
+
+        if sys.version_info >= (3, 10):
+            assert not hasattr(location, "__dict__")
+            assert not hasattr(price, "__dict__")
+            with pytest.raises(AttributeError):
+                price.unknown_attribute = 1
+        else:
+            assert hasattr(location, "__dict__")
+            price.unknown_attribute = 1
+            assert price.unknown_attribute == 1
@@ -0,0 +1,32 @@
+"""Tests for the package namespace."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import ukfuelfinder
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Tests for the lazily populated top-level namespace."""
+
+    def test_import_does_not_load_requests(self):
+        """Test that importing the package alone does not import requests."""
+        code = "import sys, ukfuelfinder; sys.exit('requests' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parents[2])
+
+        assert result.returncode == 0
+
+    @pytest.mark.parametrize("name", ukfuelfinder.__all__)
+    def test_public_names_resolve(self, name):
+        """Test that every name in __all__ can be accessed."""
+        assert getattr(ukfuelfinder, name) is not None
+        assert name in dir(ukfuelfinder)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            ukfuelfinder.missing
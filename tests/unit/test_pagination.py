@@ -0,0 +1,73 @@
+"""Unit tests for batch pagination."""
+
+import threading
+
+import pytest
+
+from ukfuelfinder.exceptions import BatchNotFoundError
+from ukfuelfinder.services.pagination import BATCH_SIZE, iter_batches
+
+
+def make_fetcher(total_records):
+    """Build a fake batch fetcher over ``total_records`` records."""
+    requested = []
+    lock = threading.Lock()
+
+    def fetch(batch_number):
+        with lock:
+            requested.append(batch_number)
+        start = (batch_number - 1) * BATCH_SIZE
+        if start >= total_records:
+            raise BatchNotFoundError(f"Batch not found: {batch_number}")
+        return list(range(start, min(start + BATCH_SIZE, total_records)))
+
+    return fetch, requested
+
+
+@pytest.mark.unit
+class TestIterBatches:
+    """Tests for iter_batches."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_yields_all_batches_in_order(self, max_workers):
+        """Test that every record is yielded once, in batch order."""
+        fetch, _ = make_fetcher(1750)
+
+        batches = list(iter_batches(fetch, max_workers=max_workers))
+
+        assert [len(b) for b in batches] == [500, 500, 500, 250]
+        assert [r for b in batches for r in b] == list(range(1750))
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_404_after_full_batch_ends_pagination(self, max_workers):
+        """Test that a 404 past the last full batch is treated as the end."""
+        fetch, _ = make_fetcher(1000)
+
+        batches = list(iter_batches(fetch, max_workers=max_workers))
+
+        assert [len(b) for b in batches] == [500, 500]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_404_on_first_batch_is_raised(self, max_workers):
+        """Test that a 404 on the first batch propagates."""
+        fetch, _ = make_fetcher(0)
+
+        with pytest.raises(BatchNotFoundError):
+            list(iter_batches(fetch, max_workers=max_workers))
+
+    def test_sequential_stops_at_short_batch(self):
+        """Test that sequential pagination makes no requests past a short batch."""
+        fetch, requested = make_fetcher(1200)
+
+        list(iter_batches(fetch, max_workers=1))
+
+        assert requested == [1, 2, 3]
+
+    def test_concurrent_requests_bounded_by_max_workers(self):
+        """Test that at most max_workers batches are requested past the last one."""
+        fetch, requested = make_fetcher(1200)
+
+        list(iter_batches(fetch, max_workers=4))
+
+        assert sorted(requested)[:3] == [1, 2, 3]
+        assert max(requested) <= 3 + 4
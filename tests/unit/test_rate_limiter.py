@@ -17,16 +17,15 @@ class TestRateLimiter:
         limiter = RateLimiter(requests_per_minute=10, daily_limit=100)
 
         # Should allow 5 requests without blocking
-        for _ in range(5):
-            limiter.acquire()  # Should not raise
+        limiter.acquire_many(5)  # Should not raise
+        limiter.acquire()
 
     def test_daily_limit_exceeded(self):
         """Test that daily limit is enforced."""
         limiter = RateLimiter(requests_per_minute=100, daily_limit=5)
 
         # Use up daily limit
-        for _ in range(5):
-            limiter.acquire()
+        limiter.acquire_many(5)
 
         # Next request should raise
         with pytest.raises(RateLimitError) as exc_info:
@@ -35,13 +34,84 @@ class TestRateLimiter:
         assert "Daily limit" in str(exc_info.value)
         assert exc_info.value.retry_after > 0
 
-    def test_handle_rate_limit_error(self):
+    def test_acquire_many_waits_for_window(self, monkeypatch):
+        """Test that a batch waits until enough requests leave the minute window."""
+        sleeps = []
+        monkeypatch.setattr("ukfuelfinder.rate_limiter.time.sleep", sleeps.append)
+        limiter = RateLimiter(requests_per_minute=4, daily_limit=100)
+
+        limiter.acquire_many(3)
+        limiter.acquire_many(2)
+
+        assert len(sleeps) == 1
+        assert 59 < sleeps[0] <= 60
+
+        with pytest.raises(ValueError):
+            limiter.acquire_many(5)
+
+    def test_wait_happens_outside_lock(self, monkeypatch):
+        """Test that a waiting caller does not hold the lock and later callers queue behind it."""
+        limiter = RateLimiter(requests_per_minute=1, daily_limit=100)
+        sleeps = []
+
+        def fake_sleep(seconds):
+            assert not limiter._lock.locked()
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("ukfuelfinder.rate_limiter.time.sleep", fake_sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        assert len(sleeps) == 2
+        assert 59 < sleeps[0] <= 60
+        assert 119 < sleeps[1] <= 120
+
+    def test_handle_rate_limit_error(self, monkeypatch):
         """Test handling of rate limit errors."""
+        sleeps = []
+        monkeypatch.setattr("ukfuelfinder.rate_limiter.time.sleep", sleeps.append)
         limiter = RateLimiter(requests_per_minute=10, daily_limit=100)
 
         # Should sleep for specified time
-        start = time.time()
         limiter.handle_rate_limit_error(retry_after=1)
-        elapsed = time.time() - start
 
-        assert elapsed >= 1.0
+        assert sleeps == [1]
+
+    def test_low_remaining_header_pauses_requests(self, monkeypatch):
+        """Test that a nearly exhausted server quota delays the next request."""
+        sleeps = []
+        monkeypatch.setattr("ukfuelfinder.rate_limiter.time.sleep", sleeps.append)
+        limiter = RateLimiter(requests_per_minute=120, daily_limit=100)
+
+        limiter.update_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+        limiter.acquire()
+
+        assert len(sleeps) == 1
+        assert 29 < sleeps[0] <= 30
+
+    def test_plentiful_remaining_header_does_not_pause(self, monkeypatch):
+        """Test that requests are not delayed while quota remains."""
+        sleeps = []
+        monkeypatch.setattr("ukfuelfinder.rate_limiter.time.sleep", sleeps.append)
+        limiter = RateLimiter(requests_per_minute=120, daily_limit=100)
+
+        limiter.update_from_headers({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "30"})
+        limiter.update_from_headers({})
+        limiter.acquire()
+
+        assert sleeps == []
+
+    def test_epoch_reset_header_pauses_on_monotonic_clock(self, monkeypatch):
+        """Test that an epoch reset header pauses for the remaining wall-clock time."""
+        sleeps = []
+        monkeypatch.setattr("ukfuelfinder.rate_limiter.time.sleep", sleeps.append)
+        limiter = RateLimiter(requests_per_minute=60, daily_limit=1000)
+
+        reset = int(time.time()) + 20
+        limiter.update_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+        limiter.acquire()
+
+        assert len(sleeps) == 1
+        assert 18 < sleeps[0] <= 20
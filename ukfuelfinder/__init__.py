@@ -6,24 +6,57 @@ Python library for accessing the UK Government Fuel Finder API.
 
 __version__ = "3.0.0"
 
-from .client import FuelFinderClient
-from .config import set_global_backward_compatible
-from .exceptions import (
-    APIError,
-    AuthenticationError,
-    ConnectionError,
-    FuelFinderError,
-    InvalidCredentialsError,
-    NetworkError,
-    NotFoundError,
-    RateLimitError,
-    ResponseParseError,
-    ServerError,
-    TimeoutError,
-    TokenExpiredError,
-    ValidationError,
-)
-from .models import PFS, Address, FuelPrice, Location, PFSInfo
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client import FuelFinderClient
+    from .config import set_global_backward_compatible
+    from .exceptions import (
+        APIError,
+        AuthenticationError,
+        ConnectionError,
+        FuelFinderError,
+        InvalidCredentialsError,
+        NetworkError,
+        NotFoundError,
+        RateLimitError,
+        ResponseParseError,
+        ServerError,
+        TimeoutError,
+        TokenExpiredError,
+        ValidationError,
+    )
+    from .geo import GeoIndex
+    from .models import PFS, Address, FuelPrice, Location, Overview, PFSInfo, index_by_node_id
+
+# Public names are imported on first access (PEP 562), so reading __version__
+# or importing a submodule does not pull in requests
+_LAZY = {
+    "FuelFinderClient": ".client",
+    "set_global_backward_compatible": ".config",
+    "APIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "ConnectionError": ".exceptions",
+    "FuelFinderError": ".exceptions",
+    "InvalidCredentialsError": ".exceptions",
+    "NetworkError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "ResponseParseError": ".exceptions",
+    "ServerError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "TokenExpiredError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "GeoIndex": ".geo",
+    "PFS": ".models",
+    "Address": ".models",
+    "FuelPrice": ".models",
+    "Location": ".models",
+    "Overview": ".models",
+    "PFSInfo": ".models",
+    "index_by_node_id": ".models",
+}
 
 __all__ = [
     "FuelFinderClient",
@@ -45,5 +78,21 @@ __all__ = [
     "FuelPrice",
     "Address",
     "Location",
+    "Overview",
+    "GeoIndex",
+    "index_by_node_id",
     "set_global_backward_compatible",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
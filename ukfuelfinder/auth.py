@@ -2,55 +2,114 @@
 OAuth 2.0 authentication for UK Fuel Finder API.
 """
 
+import logging
 import threading
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import requests
 
 from .exceptions import AuthenticationError, InvalidCredentialsError
+from .json_utils import loads
+
+logger = logging.getLogger(__name__)
+
+# A token this close to expiry is still used while a fresh one is fetched
+# in the background; closer than that, callers wait for the new token
+REFRESH_MARGIN = 60
+EXPIRY_MARGIN = 10
 
 
 class OAuth2Authenticator:
     """Manages OAuth 2.0 authentication and token lifecycle."""
 
-    def __init__(self, client_id: str, client_secret: str, token_url: str, refresh_url: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token_url: str,
+        refresh_url: str,
+        session: Optional[requests.Session] = None,
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.token_url = token_url
         self.refresh_url = refresh_url
+        self.session = session or requests.Session()
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expiry: float = 0
-        self._lock = threading.Lock()
+        self._refresh_at: float = 0
+        self._refresh_in_flight = False
+        # Reentrant so token storage can lock whether or not get_token holds it
+        self._lock = threading.RLock()
 
     def get_token(self) -> str:
-        """Get valid access token, refreshing if necessary."""
+        """
+        Get valid access token, refreshing if necessary.
+
+        Once the token is within REFRESH_MARGIN seconds of expiry it is still
+        returned while a replacement is fetched in a background thread, so
+        requests do not stall on the token endpoint.
+        """
         with self._lock:
             if self._is_token_valid():
                 return self._access_token  # type: ignore
 
-            # Try refresh token first if available
-            if self._refresh_token:
-                try:
-                    return self._refresh_access_token()
-                except AuthenticationError:
-                    # Fall back to generating new token
-                    pass
+            if self._access_token and time.time() < self._token_expiry - EXPIRY_MARGIN:
+                if not self._refresh_in_flight:
+                    self._refresh_in_flight = True
+                    threading.Thread(target=self._renew_in_background, daemon=True).start()
+                return self._access_token
+
+            return self._renew()
 
-            return self._generate_token()
+    def _renew(self) -> str:
+        """Obtain a new access token, preferring the refresh token."""
+        # Try refresh token first if available
+        if self._refresh_token:
+            try:
+                return self._refresh_access_token()
+            except AuthenticationError:
+                # Fall back to generating new token
+                pass
+
+        return self._generate_token()
+
+    def _renew_in_background(self) -> None:
+        """Renew the token off the request path; failures retry on the next call."""
+        try:
+            self._renew()
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refresh_in_flight = False
 
     def _is_token_valid(self) -> bool:
         """Check if current token is valid and not expiring soon."""
         if not self._access_token:
             return False
-        # Refresh 60 seconds before expiry
-        return time.time() < (self._token_expiry - 60)
+        return time.time() < self._refresh_at
+
+    def _store_token(
+        self, data: Dict[str, Any], previous_refresh_token: Optional[str] = None
+    ) -> str:
+        """Store the token from a token endpoint response and return it."""
+        # Handle nested response structure
+        token_data = data.get("data", data)
+
+        with self._lock:
+            self._access_token = token_data["access_token"]
+            self._refresh_token = token_data.get("refresh_token", previous_refresh_token)
+            self._token_expiry = time.time() + token_data["expires_in"]
+            self._refresh_at = self._token_expiry - REFRESH_MARGIN
+            return self._access_token
 
     def _generate_token(self) -> str:
         """Generate new access token using client credentials."""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.token_url,
                 json={"client_id": self.client_id, "client_secret": self.client_secret},
                 headers={"Content-Type": "application/json"},
@@ -61,21 +120,9 @@ class OAuth2Authenticator:
                 raise InvalidCredentialsError("Invalid client credentials")
 
             response.raise_for_status()
-            data = response.json()
+            return self._store_token(loads(response.content))
 
-            # Handle nested response structure
-            if "data" in data:
-                token_data = data["data"]
-            else:
-                token_data = data
-
-            self._access_token = token_data["access_token"]
-            self._refresh_token = token_data.get("refresh_token")
-            self._token_expiry = time.time() + token_data["expires_in"]
-
-            return self._access_token
-
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             raise AuthenticationError(f"Failed to generate access token: {e}")
 
     def _refresh_access_token(self) -> str:
@@ -84,7 +131,7 @@ class OAuth2Authenticator:
             raise AuthenticationError("No refresh token available")
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.refresh_url,
                 json={"client_id": self.client_id, "refresh_token": self._refresh_token},
                 headers={"Content-Type": "application/json"},
@@ -95,19 +142,7 @@ class OAuth2Authenticator:
                 raise AuthenticationError("Refresh token expired or invalid")
 
             response.raise_for_status()
-            data = response.json()
-
-            # Handle nested response structure
-            if "data" in data:
-                token_data = data["data"]
-            else:
-                token_data = data
-
-            self._access_token = token_data["access_token"]
-            self._refresh_token = token_data.get("refresh_token", self._refresh_token)
-            self._token_expiry = time.time() + token_data["expires_in"]
-
-            return self._access_token
+            return self._store_token(loads(response.content), self._refresh_token)
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             raise AuthenticationError(f"Failed to refresh access token: {e}")
@@ -2,18 +2,36 @@
 Response caching for UK Fuel Finder API client.
 """
 
+import gzip
 import hashlib
-import json
+import heapq
+import os
+import re
+import tempfile
 import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .json_utils import dumps, loads
+
+# DiskCache only reads and deletes files named like this, since the directory
+# may be shared with unrelated files
+_FILE_PREFIX = "ukfuelfinder-"
+_FILE_RE = re.compile(r"ukfuelfinder-[0-9a-f]{32}\.json\.gz")
 
 
 class ResponseCache:
-    """In-memory cache with TTL support."""
+    """In-memory cache with TTL support and least-recently-used eviction."""
 
-    def __init__(self) -> None:
-        self._cache: Dict[str, tuple[Any, float]] = {}
+    def __init__(
+        self, maxsize: int = 1024, time_func: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self._now = time_func
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
@@ -21,13 +39,14 @@ class ResponseCache:
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
         with self._lock:
-            if key in self._cache:
-                value, expiry = self._cache[key]
-                if time.time() < expiry:
+            entry = self._cache.get(key)
+            if entry is not None:
+                value, expiry = entry
+                if self._now() < expiry:
+                    self._cache.move_to_end(key)
                     self._hits += 1
                     return value
-                else:
-                    del self._cache[key]
+                del self._cache[key]
 
             self._misses += 1
             return None
@@ -35,26 +54,60 @@ class ResponseCache:
     def set(self, key: str, value: Any, ttl: int) -> None:
         """Store value in cache with TTL in seconds."""
         with self._lock:
-            expiry = time.time() + ttl
-            self._cache[key] = (value, expiry)
+            now = self._now()
+            self._purge(now)
+            self._store(key, value, now + ttl)
+
+    def _store(self, key: str, value: Any, expiry: float) -> None:
+        """Insert an entry, evicting the least recently used. Caller must hold the lock."""
+        cache = self._cache
+        cache[key] = (value, expiry)
+        cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        while len(cache) > self.maxsize:
+            # Heap entries for evicted keys are skipped by _purge
+            cache.popitem(last=False)
+
+    def purge(self) -> int:
+        """Remove expired entries, returning how many were removed."""
+        with self._lock:
+            return self._purge(self._now())
+
+    def _purge(self, now: float) -> int:
+        """Pop expired entries off the expiry heap. Caller must hold the lock."""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            # Skip heap entries left behind by keys that were since overwritten
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == expiry:
+                del self._cache[key]
+                removed += 1
+        return removed
 
     def clear(self) -> None:
         """Clear all cached data."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
             self._hits = 0
             self._misses = 0
 
     def generate_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Generate cache key from endpoint and parameters."""
-        if params:
-            # Sort params for consistent key generation
-            sorted_params = json.dumps(params, sort_keys=True)
-            key_str = f"{endpoint}:{sorted_params}"
-        else:
-            key_str = endpoint
+        # Sort params for consistent key generation
+        return self.generate_key_from_items(
+            endpoint, tuple(sorted(params.items())) if params else ()
+        )
 
-        return hashlib.md5(key_str.encode()).hexdigest()
+    def generate_key_from_items(self, endpoint: str, items: Tuple[Tuple[str, Any], ...]) -> str:
+        """Generate cache key from endpoint and parameter items already sorted by name."""
+        # The canonical string is itself the key; DiskCache hashes it for filenames
+        if items:
+            sorted_params = "&".join(f"{name}={value!r}" for name, value in items)
+            return f"{endpoint}?{sorted_params}"
+        return endpoint
 
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
@@ -68,3 +121,85 @@ class ResponseCache:
                 "hit_rate": round(hit_rate, 2),
                 "size": len(self._cache),
             }
+
+
+class DiskCache(ResponseCache):
+    """
+    Cache backed by gzipped JSON files so responses survive between processes.
+
+    Entries are also held in memory, so repeated lookups within a process do
+    not touch the disk. Cached values must be JSON serializable. Files are
+    named ``ukfuelfinder-<hash>.json.gz``, and only those are ever removed.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        maxsize: int = 1024,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(maxsize, time_func)
+        if directory is None:
+            base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+            directory = Path(base) / "ukfuelfinder"
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.directory / f"{_FILE_PREFIX}{digest}.json.gz"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from memory or disk if not expired."""
+        value = super().get(key)
+        if value is not None:
+            return value
+
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = loads(f.read())
+            ttl = entry["expiry"] - time.time()
+            value = entry["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable or not an entry written by DiskCache
+            return None
+
+        if ttl <= 0:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+
+        with self._lock:
+            # Promote to memory; the earlier lookup already counted a miss
+            self._store(key, value, self._now() + ttl)
+            self._misses -= 1
+            self._hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store value in memory and on disk with TTL in seconds."""
+        super().set(key, value, ttl)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=_FILE_PREFIX, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                # Wall-clock expiry so it stays meaningful to other processes
+                f.write(dumps({"expiry": time.time() + ttl, "value": value}))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Clear all cached data from memory and disk, leaving other files alone."""
+        super().clear()
+        for path in self.directory.glob(f"{_FILE_PREFIX}*.json.gz"):
+            if not _FILE_RE.fullmatch(path.name):
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -2,17 +2,19 @@
 Main client for UK Fuel Finder API.
 """
 
-import os
-from math import asin, cos, radians, sin, sqrt
-from typing import Any, Iterator, List, Optional, Tuple, Union
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+import requests
 
 from .auth import OAuth2Authenticator
-from .cache import ResponseCache
-from .compatibility import BackwardCompatibleResponse
-from .config import Config, get_global_backward_compatible
+from .cache import DiskCache, ResponseCache
+from .compatibility import BackwardCompatibleResponse, wrap_response
+from .config import Config, resolve_backward_compatible
 from .exceptions import BatchNotFoundError, InvalidBatchNumberError
-from .http_client import HTTPClient
-from .models import PFS, FuelPrice, PFSInfo
+from .geo import GeoIndex, haversine
+from .http_client import HTTPClient, create_session
+from .models import PFS, FuelPrice, Overview, PFSInfo, index_by_node_id
 from .rate_limiter import RateLimiter
 from .services.forecourt_service import ForecourtService
 from .services.price_service import PriceService
@@ -29,6 +31,12 @@ class FuelFinderClient:
         ... )
         >>> prices = client.get_all_pfs_prices()
 
+    The client holds a pooled HTTP session; use it as a context manager or
+    call ``close()`` to release connections:
+
+        >>> with FuelFinderClient() as client:
+        ...     prices = client.get_all_pfs_prices()
+
     Backward Compatibility:
         >>> # With backward compatibility (default)
         >>> client = FuelFinderClient(backward_compatible=True)
@@ -50,6 +58,9 @@ class FuelFinderClient:
         cache_enabled: bool = True,
         timeout: int = 30,
         backward_compatible: bool = True,
+        session: Optional[requests.Session] = None,
+        max_workers: int = 4,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize Fuel Finder client.
@@ -61,6 +72,12 @@ class FuelFinderClient:
             cache_enabled: Enable response caching
             timeout: Request timeout in seconds
             backward_compatible: Enable backward compatibility mode for API changes
+            session: Optional requests session to share across clients. A pooled
+                session is created (and closed by ``close()``) if not provided.
+            max_workers: Maximum concurrent batch requests when fetching all
+                batches (1 disables concurrency)
+            cache_dir: Directory for a persistent response cache shared between
+                runs (e.g. ``~/.cache/ukfuelfinder``). Memory-only if not provided.
         """
         if client_id and client_secret:
             self.config = Config(
@@ -69,27 +86,25 @@ class FuelFinderClient:
                 environment=environment,
                 timeout=timeout,
                 cache_enabled=cache_enabled,
+                max_workers=max_workers,
             )
         else:
             self.config = Config.from_env(environment)
+            self.config.max_workers = max_workers
 
         # Priority: global config > env var > parameter
-        global_config = get_global_backward_compatible()
-        env_backward_compatible = os.getenv("UKFUELFINDER_BACKWARD_COMPATIBLE")
-
-        if global_config is not None:
-            self.backward_compatible = global_config
-        elif env_backward_compatible is not None:
-            self.backward_compatible = env_backward_compatible.lower() in ("1", "true", "yes")
-        else:
-            self.backward_compatible = backward_compatible
+        self.backward_compatible = resolve_backward_compatible(backward_compatible)
 
         # Initialize components
+        self._owns_session = session is None
+        self.session = session or create_session(pool_maxsize=max(10, self.config.max_workers))
+
         self.authenticator = OAuth2Authenticator(
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
             token_url=self.config.token_url,
             refresh_url=self.config.refresh_url,
+            session=self.session,
         )
 
         self.rate_limiter = RateLimiter(
@@ -102,13 +117,24 @@ class FuelFinderClient:
             authenticator=self.authenticator,
             rate_limiter=self.rate_limiter,
             timeout=self.config.timeout,
+            session=self.session,
+            conditional_requests=self.config.cache_enabled,
         )
 
-        self.cache = ResponseCache() if self.config.cache_enabled else None
+        self._geo_index: Optional[GeoIndex[Any]] = None
+        # Parsed results of the full listings, so repeat calls return the same list
+        self._listing_memo = ResponseCache(maxsize=2)
+        self._node_indexes: Dict[str, Tuple[List[Any], Dict[str, Any]]] = {}
+
+        self.cache: Optional[ResponseCache] = None
+        if self.config.cache_enabled:
+            self.cache = DiskCache(cache_dir) if cache_dir else ResponseCache()
 
         # Initialize services
         self.price_service = PriceService(self.http_client, self.cache or ResponseCache())
         self.forecourt_service = ForecourtService(self.http_client, self.cache or ResponseCache())
+        self.price_service.max_workers = self.config.max_workers
+        self.forecourt_service.max_workers = self.config.max_workers
 
     # Price methods
     def get_all_pfs_prices(
@@ -120,6 +146,11 @@ class FuelFinderClient:
         """
         Get all PFS fuel prices.
 
+        With caching enabled, the full listing is kept for the price cache TTL
+        and repeat calls (including get_pfs and get_prices_by_fuel_type) reuse
+        it. Each call returns a new list, but the PFS objects in it are shared
+        between calls, so copy a record before editing it.
+
         Args:
             batch_number: Batch number for pagination (500 per batch).
                          If None, automatically fetches all batches.
@@ -129,6 +160,28 @@ class FuelFinderClient:
         Returns:
             List of PFS with fuel prices
         """
+        if batch_number is None and effective_start_timestamp is None and not kwargs:
+            listing = self._prices_listing()
+            return list(listing) if self.cache is not None else listing
+        return self._fetch_prices(batch_number, effective_start_timestamp, **kwargs)
+
+    def _prices_listing(self) -> List[Any]:
+        """Return the full price listing, memoised when caching is enabled; do not modify it."""
+        if self.cache is None:
+            return self._fetch_prices()
+        listing = self._listing_memo.get("/pfs/fuel-prices")
+        if listing is None:
+            listing = self._fetch_prices()
+            self._listing_memo.set("/pfs/fuel-prices", listing, self.price_service.cache_ttl)
+        return listing  # type: ignore[no-any-return]
+
+    def _fetch_prices(
+        self,
+        batch_number: Optional[int] = None,
+        effective_start_timestamp: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Fetch prices from the price service, wrapping them if enabled."""
         try:
             if batch_number is not None:
                 # Fetch specific batch
@@ -150,7 +203,7 @@ class FuelFinderClient:
 
         # Apply backward compatibility wrapper if enabled
         if self.backward_compatible:
-            return [BackwardCompatibleResponse(pfs) for pfs in pfs_list]
+            return [wrap_response(pfs) for pfs in pfs_list]
         return pfs_list
 
     def get_pfs(self, node_id: str) -> Optional[Union[PFS, BackwardCompatibleResponse[PFS]]]:
@@ -163,12 +216,12 @@ class FuelFinderClient:
         Returns:
             PFS object or None if not found
         """
-        all_pfs = self.get_all_pfs_prices()
-        pfs = self.price_service.get_pfs_by_node_id(node_id, all_pfs)
+        listing = self._prices_listing()
+        pfs: Optional[PFS] = self._find_by_node_id("prices", listing, node_id)
 
         # Apply backward compatibility wrapper if enabled
         if pfs and self.backward_compatible:
-            return BackwardCompatibleResponse(pfs)
+            return wrap_response(pfs)
         return pfs
 
     def get_prices_by_fuel_type(self, fuel_type: str) -> List[FuelPrice]:
@@ -181,9 +234,24 @@ class FuelFinderClient:
         Returns:
             List of fuel prices
         """
-        all_pfs = self.get_all_pfs_prices()
+        all_pfs = self._prices_listing()
         return self.price_service.get_prices_by_fuel_type(fuel_type, all_pfs)
 
+    def get_overview(self, fuel_types: Optional[Iterable[str]] = None) -> Overview:
+        """
+        Get all PFS fuel prices with a per-fuel-type index from a single fetch.
+
+        Use this instead of separate get_all_pfs_prices() and
+        get_prices_by_fuel_type() calls, which each fetch every batch.
+
+        Args:
+            fuel_types: Fuel types to index (default: all)
+
+        Returns:
+            Overview of all PFS and their prices grouped by fuel type
+        """
+        return Overview.from_pfs_list(self.get_all_pfs_prices(), fuel_types)
+
     def get_incremental_price_updates(
         self, since_timestamp: str, **kwargs: Any
     ) -> Union[List[PFS], List[BackwardCompatibleResponse[PFS]]]:
@@ -201,7 +269,7 @@ class FuelFinderClient:
 
         # Apply backward compatibility wrapper if enabled
         if self.backward_compatible:
-            return [BackwardCompatibleResponse(pfs) for pfs in pfs_list]
+            return [wrap_response(pfs) for pfs in pfs_list]
         return pfs_list
 
     # Forecourt methods
@@ -211,6 +279,11 @@ class FuelFinderClient:
         """
         Get all PFS information.
 
+        With caching enabled, the full listing is kept for the forecourt cache
+        TTL and reused by repeat calls. Each call returns a new list, but the
+        PFSInfo objects in it are shared between calls, so copy a record
+        before editing it.
+
         Args:
             batch_number: Batch number for pagination (500 per batch).
                          If None, automatically fetches all batches.
@@ -219,26 +292,60 @@ class FuelFinderClient:
         Returns:
             List of PFS information
         """
+        if batch_number is None and not kwargs:
+            listing = self._info_listing()
+            return list(listing) if self.cache is not None else listing
+        return self._fetch_info(batch_number, **kwargs)
+
+    def _info_listing(self) -> List[Any]:
+        """Return the full site listing, memoised when caching is enabled; do not modify it."""
+        if self.cache is None:
+            return self._fetch_info()
+        listing = self._listing_memo.get("/pfs")
+        if listing is None:
+            listing = self._fetch_info()
+            self._listing_memo.set("/pfs", listing, self.forecourt_service.cache_ttl)
+        return listing  # type: ignore[no-any-return]
+
+    def _fetch_info(self, batch_number: Optional[int] = None, **kwargs: Any) -> List[Any]:
+        """Fetch site information from the forecourt service, wrapping it if enabled."""
         try:
             if batch_number is not None:
                 # Fetch specific batch
                 pfs_list = self.forecourt_service.get_all_pfs(batch_number=batch_number, **kwargs)
-            else:
-                # Fetch all batches automatically
-                all_pfs = []
-                for batch in self.forecourt_service.get_all_pfs_paginated(**kwargs):
-                    all_pfs.extend(batch)
-                pfs_list = all_pfs
+                # Apply backward compatibility wrapper if enabled
+                if self.backward_compatible:
+                    return [wrap_response(pfs) for pfs in pfs_list]
+                return pfs_list
+            # Fetch all batches automatically (already wrapped if enabled)
+            return list(self.iter_all_pfs_info(**kwargs))
         except BatchNotFoundError as e:
             # Handle backward compatibility for batch errors
             if self.backward_compatible:
                 raise InvalidBatchNumberError(f"Invalid batch number: {batch_number}") from e
             raise
 
-        # Apply backward compatibility wrapper if enabled
-        if self.backward_compatible:
-            return [BackwardCompatibleResponse(pfs) for pfs in pfs_list]
-        return pfs_list
+    def iter_all_pfs_info(
+        self, **kwargs: Any
+    ) -> Iterator[Union[PFSInfo, BackwardCompatibleResponse[PFSInfo]]]:
+        """
+        Iterate over all PFS information as each batch arrives.
+
+        Unlike get_all_pfs_info(), the full listing is never held in memory,
+        so use this for a single pass over every station.
+
+        Args:
+            **kwargs: Additional parameters
+
+        Yields:
+            PFS information
+        """
+        for batch in self.forecourt_service.get_all_pfs_paginated(**kwargs):
+            # Apply backward compatibility wrapper if enabled
+            if self.backward_compatible:
+                yield from (wrap_response(pfs) for pfs in batch)
+            else:
+                yield from batch
 
     def get_incremental_pfs_info(
         self, since_timestamp: str, **kwargs: Any
@@ -259,7 +366,7 @@ class FuelFinderClient:
 
         # Apply backward compatibility wrapper if enabled
         if self.backward_compatible:
-            return [BackwardCompatibleResponse(pfs) for pfs in pfs_list]
+            return [wrap_response(pfs) for pfs in pfs_list]
         return pfs_list
 
     def get_pfs_info(
@@ -274,12 +381,12 @@ class FuelFinderClient:
         Returns:
             PFSInfo object or None if not found
         """
-        all_pfs = self.get_all_pfs_info()
-        pfs = self.forecourt_service.get_pfs_by_node_id(node_id, all_pfs)
+        listing = self._info_listing()
+        pfs: Optional[PFSInfo] = self._find_by_node_id("info", listing, node_id)
 
         # Apply backward compatibility wrapper if enabled
         if pfs and self.backward_compatible:
-            return BackwardCompatibleResponse(pfs)
+            return wrap_response(pfs)
         return pfs
 
     def get_all_pfs_paginated(
@@ -294,15 +401,36 @@ class FuelFinderClient:
         for batch in self.forecourt_service.get_all_pfs_paginated():
             # Apply backward compatibility wrapper if enabled
             if self.backward_compatible:
-                yield [BackwardCompatibleResponse(pfs) for pfs in batch]
+                yield [wrap_response(pfs) for pfs in batch]
             else:
                 yield batch
 
     # Utility methods
+    def close(self) -> None:
+        """Close the HTTP session if it was created by this client."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "FuelFinderClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
     def clear_cache(self) -> None:
         """Clear all cached responses."""
         if self.cache:
             self.cache.clear()
+        self.http_client.clear_cache()
+        self.price_service.clear_cache()
+        self.forecourt_service.clear_cache()
+        self._listing_memo.clear()
+        self._node_indexes.clear()
 
     def set_cache_ttl(self, resource_type: str, ttl: int) -> None:
         """
@@ -337,36 +465,22 @@ class FuelFinderClient:
         Returns:
             List of tuples (distance_km, PFSInfo) sorted by distance
         """
-        sites = self.get_all_pfs_info()
-        nearby = []
-
-        for site in sites:
-            # Unwrap if it's a BackwardCompatibleResponse for distance calculation
-            actual_site = site._response if hasattr(site, "_response") else site
-
-            if (
-                actual_site.location
-                and actual_site.location.latitude
-                and actual_site.location.longitude
-            ):
-                distance = self._haversine(
-                    longitude,
-                    latitude,
-                    actual_site.location.longitude,
-                    actual_site.location.latitude,
-                )
-                if distance <= radius_km:
-                    nearby.append((distance, site))
+        sites = self._info_listing()
+
+        # Reuse the index while the same site list is returned
+        if self._geo_index is None or self._geo_index.sites is not sites:
+            self._geo_index = GeoIndex(sites)
+        return self._geo_index.search(latitude, longitude, radius_km)
 
-        nearby.sort(key=lambda x: x[0])
-        return nearby
+    def _find_by_node_id(self, kind: str, listing: List[Any], node_id: str) -> Any:
+        """Look up a record by node ID, reusing the index while the same listing is returned."""
+        indexed = self._node_indexes.get(kind)
+        if indexed is None or indexed[0] is not listing:
+            indexed = (listing, index_by_node_id(listing))
+            self._node_indexes[kind] = indexed
+        return indexed[1].get(node_id)
 
     @staticmethod
     def _haversine(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
         """Calculate distance between two points in kilometers using Haversine formula."""
-        lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * asin(sqrt(a))
-        return 6371 * c
+        return haversine(lon1, lat1, lon2, lat2)
@@ -2,8 +2,10 @@
 Backward compatibility layer for API changes.
 """
 
+import dataclasses
 import warnings
-from typing import Any, Generic, TypeVar
+from operator import attrgetter
+from typing import Any, Dict, Generic, Set, Type, TypeVar
 
 T = TypeVar("T")
 
@@ -11,29 +13,39 @@ T = TypeVar("T")
 class BackwardCompatibleResponse(Generic[T]):
     """Wrapper to provide backward compatibility for API responses."""
 
+    # One wrapper per record in a full listing, so skip the per-instance __dict__
+    __slots__ = ("_response",)
+
+    # Deprecated fields already warned about; each warns once per process
+    _warned: Set[str] = set()
+
     def __init__(self, response: T):
         self._response = response
 
     @property
     def success(self) -> bool:
         """Always return True for backward compatibility."""
-        warnings.warn(
-            "The 'success' field is deprecated and will be removed in a future version. "
-            "The API no longer returns this field.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        if "success" not in self._warned:
+            self._warned.add("success")
+            warnings.warn(
+                "The 'success' field is deprecated and will be removed in a future version. "
+                "The API no longer returns this field.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         return True
 
     @property
     def message(self) -> str:
         """Return empty string for backward compatibility."""
-        warnings.warn(
-            "The 'message' field is deprecated and will be removed in a future version. "
-            "The API no longer returns this field.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        if "message" not in self._warned:
+            self._warned.add("message")
+            warnings.warn(
+                "The 'message' field is deprecated and will be removed in a future version. "
+                "The API no longer returns this field.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         return ""
 
     def __getattr__(self, name: str) -> Any:
@@ -45,3 +57,31 @@ class BackwardCompatibleResponse(Generic[T]):
 
     def __str__(self) -> str:
         return str(self._response)
+
+
+# Forwarding subclass per wrapped dataclass, built on first use
+_WRAPPER_CACHE: Dict[type, Type[BackwardCompatibleResponse[Any]]] = {}
+
+
+def _wrapper_class(cls: type) -> Type[BackwardCompatibleResponse[Any]]:
+    """Build a BackwardCompatibleResponse subclass with a descriptor per dataclass field."""
+    namespace: Dict[str, Any] = {"__slots__": ()}
+    if dataclasses.is_dataclass(cls):
+        for field in dataclasses.fields(cls):
+            if not hasattr(BackwardCompatibleResponse, field.name):
+                namespace[field.name] = property(attrgetter(f"_response.{field.name}"))
+    return type(f"BackwardCompatible{cls.__name__}", (BackwardCompatibleResponse,), namespace)
+
+
+def wrap_response(response: T) -> BackwardCompatibleResponse[T]:
+    """
+    Wrap a response for backward compatibility.
+
+    Field reads on the returned wrapper go straight to a property instead of
+    falling back to __getattr__. Other attributes are still delegated.
+    """
+    cls = type(response)
+    wrapper = _WRAPPER_CACHE.get(cls)
+    if wrapper is None:
+        wrapper = _WRAPPER_CACHE.setdefault(cls, _wrapper_class(cls))
+    return wrapper(response)
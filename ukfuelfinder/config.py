@@ -31,6 +31,32 @@ def get_global_backward_compatible() -> Optional[bool]:
     return _global_backward_compatible
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in ("1", "true", "yes")
+
+
+def resolve_backward_compatible(parameter: bool) -> bool:
+    """
+    Resolve backward compatibility mode for a new client.
+
+    Priority: global config > UKFUELFINDER_BACKWARD_COMPATIBLE env var > parameter.
+    The environment is read on each call so changes take effect for new clients.
+
+    Args:
+        parameter: Value passed to the client constructor
+
+    Returns:
+        Effective backward compatibility setting
+    """
+    if _global_backward_compatible is not None:
+        return _global_backward_compatible
+    env_value = os.environ.get("UKFUELFINDER_BACKWARD_COMPATIBLE")
+    if env_value is not None:
+        return _parse_bool(env_value)
+    return parameter
+
+
 @dataclass
 class Config:
     """Configuration for Fuel Finder API client."""
@@ -42,6 +68,7 @@ class Config:
     cache_enabled: bool = True
     rate_limit_rpm: int = 120
     rate_limit_daily: int = 10000
+    max_workers: int = 4
 
     @property
     def base_url(self) -> str:
@@ -0,0 +1,148 @@
+"""
+Geographic search for UK Fuel Finder API client.
+"""
+
+from math import asin, cos, degrees, floor, inf, pi, radians, sin, sqrt
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from .compatibility import BackwardCompatibleResponse
+
+T = TypeVar("T")
+
+EARTH_RADIUS_KM = 6371
+
+
+def haversine(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Calculate distance between two points in kilometers using Haversine formula."""
+    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+    c = 2 * asin(sqrt(a))
+    return EARTH_RADIUS_KM * c
+
+
+def bounding_box(latitude: float, radius_km: float) -> Tuple[float, Optional[float]]:
+    """
+    Calculate the latitude and longitude spans (in degrees) enclosing a radius.
+
+    The spans never exclude a point within the radius. The longitude span is
+    None when the box reaches a pole.
+    """
+    half_angle = radius_km / EARTH_RADIUS_KM / 2
+    lat_span = degrees(2 * half_angle)
+
+    # The narrowest longitude span is at the box edge furthest from the equator
+    max_abs_lat = abs(latitude) + lat_span
+    if half_angle >= pi / 2 or max_abs_lat >= 90:
+        return lat_span, None
+    ratio = sin(half_angle) / sqrt(cos(radians(latitude)) * cos(radians(max_abs_lat)))
+    if ratio >= 1:
+        return lat_span, None
+    return lat_span, degrees(2 * asin(ratio))
+
+
+# Indexed site: latitude and longitude in radians, cos(latitude), site
+_Entry = Tuple[float, float, float, T]
+
+
+class GeoIndex(Generic[T]):
+    """
+    Grid index over site coordinates for repeated radius searches.
+
+    Sites are bucketed into square cells of ``cell_degrees``; a search only
+    examines the cells overlapping the bounding box of its radius. Sites
+    without coordinates are not indexed.
+
+    Example:
+        >>> index = GeoIndex(client.get_all_pfs_info())
+        >>> for lat, lon in depots:
+        ...     nearby = index.search(lat, lon, radius_km=10)
+    """
+
+    def __init__(self, sites: Sequence[T], cell_degrees: float = 0.1):
+        self.sites = sites
+        self.cell_degrees = cell_degrees
+        self._cells: Dict[Tuple[int, int], List[_Entry[T]]] = {}
+
+        for site in sites:
+            # Unwrap BackwardCompatibleResponse to skip attribute delegation
+            actual_site: Any = (
+                site._response if isinstance(site, BackwardCompatibleResponse) else site
+            )
+            location = actual_site.location
+            if not (location and location.latitude and location.longitude):
+                continue
+            lat, lon = location.latitude, location.longitude
+            key = (floor(lat / cell_degrees), floor(lon / cell_degrees))
+            # Per-site trig is computed once here rather than on every search
+            lat_rad = radians(lat)
+            self._cells.setdefault(key, []).append((lat_rad, radians(lon), cos(lat_rad), site))
+
+    def _candidate_cells(
+        self, min_lat: float, max_lat: float, min_lon: Optional[float], max_lon: Optional[float]
+    ) -> List[Sequence[_Entry[T]]]:
+        """Get the occupied cells overlapping a bounding box (in degrees)."""
+        size = self.cell_degrees
+        rows = range(floor(min_lat / size), floor(max_lat / size) + 1)
+        if min_lon is None or max_lon is None:
+            return [cell for (row, _), cell in self._cells.items() if row in rows]
+
+        cols = range(floor(min_lon / size), floor(max_lon / size) + 1)
+        if len(rows) * len(cols) <= len(self._cells):
+            get = self._cells.get
+            return [get((row, col), ()) for row in rows for col in cols]
+        # Large radius: cheaper to walk the occupied cells
+        return [cell for (row, col), cell in self._cells.items() if row in rows and col in cols]
+
+    def search(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[float, T]]:
+        """
+        Find indexed sites within a radius.
+
+        Args:
+            latitude: Search center latitude
+            longitude: Search center longitude
+            radius_km: Search radius in kilometers
+
+        Returns:
+            List of tuples (distance_km, site) sorted by distance
+        """
+        lat_span, lon_span = bounding_box(latitude, radius_km)
+        if lon_span is not None and abs(longitude) + lon_span > 180:
+            lon_span = None  # Box wraps the antimeridian
+
+        lat1 = radians(latitude)
+        lon1 = radians(longitude)
+        cos_lat1 = cos(lat1)
+        min_lat, max_lat = lat1 - radians(lat_span), lat1 + radians(lat_span)
+        if lon_span is None:
+            cells = self._candidate_cells(latitude - lat_span, latitude + lat_span, None, None)
+            min_lon, max_lon = -inf, inf
+        else:
+            cells = self._candidate_cells(
+                latitude - lat_span,
+                latitude + lat_span,
+                longitude - lon_span,
+                longitude + lon_span,
+            )
+            min_lon, max_lon = lon1 - radians(lon_span), lon1 + radians(lon_span)
+
+        # Distance grows with the haversine term, so compare that first and
+        # only take asin/sqrt for sites that are in range
+        half_angle = min(pi / 2, radius_km / EARTH_RADIUS_KM / 2)
+        a_limit = min(1.0, sin(half_angle) ** 2 * (1 + 1e-12))
+
+        nearby = []
+        for cell in cells:
+            for lat2, lon2, cos_lat2, site in cell:
+                if not (min_lat <= lat2 <= max_lat and min_lon <= lon2 <= max_lon):
+                    continue
+                a = sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * sin((lon2 - lon1) / 2) ** 2
+                if a > a_limit:
+                    continue
+                distance = EARTH_RADIUS_KM * 2 * asin(sqrt(a))
+                if distance <= radius_km:
+                    nearby.append((distance, site))
+
+        nearby.sort(key=lambda x: x[0])
+        return nearby
@@ -3,20 +3,48 @@ HTTP client for UK Fuel Finder API.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .auth import OAuth2Authenticator
+from .cache import ResponseCache
 from .exceptions import BatchNotFoundError
 from .exceptions import ConnectionError as FuelFinderConnectionError
 from .exceptions import NotFoundError, RateLimitError, ResponseParseError, ServerError
 from .exceptions import TimeoutError as FuelFinderTimeoutError
 from .exceptions import ValidationError
+from .json_utils import loads
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Paginated endpoints, matched as whole path segments
+_BATCH_PATH_RE = re.compile(r"/(?:pfs|fuel-prices)(?:/|$)")
+
+
+def create_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Create a session with a keep-alive connection pool.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    # The API only serves UTF-8 JSON, which is decoded from bytes without charset sniffing
+    session.headers["Accept"] = "application/json"
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class HTTPClient:
     """HTTP client with authentication and error handling."""
@@ -27,40 +55,99 @@ class HTTPClient:
         authenticator: OAuth2Authenticator,
         rate_limiter: RateLimiter,
         timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        conditional_requests: bool = True,
     ):
         self.base_url = base_url
         self.authenticator = authenticator
         self.rate_limiter = rate_limiter
         self.timeout = timeout
-        self.session = requests.Session()
-
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Make GET request to API."""
-        return self._make_request("GET", endpoint, params=params)
+        self.session = session or create_session()
+        # (token, headers) pair, replaced as a whole when the token rotates
+        self._auth_header: Tuple[str, Dict[str, str]] = ("", {})
+        # (conditional headers, data) per GET whose response carried an ETag or Last-Modified
+        self._validated: Optional[ResponseCache] = (
+            ResponseCache(maxsize=256) if conditional_requests else None
+        )
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        validator_ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Make GET request to API.
+
+        Args:
+            endpoint: Path relative to the base URL
+            params: Query parameters
+            validator_ttl: If given, keep the body with its ETag / Last-Modified
+                for this many seconds so a repeat request can be answered by a 304
+        """
+        return self._make_request("GET", endpoint, params=params, validator_ttl=validator_ttl)
+
+    def clear_cache(self) -> None:
+        """Drop bodies kept for conditional requests."""
+        if self._validated is not None:
+            self._validated.clear()
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Return the Authorization header, rebuilt only when the token changes."""
+        token = self.authenticator.get_token()
+        cached_token, headers = self._auth_header
+        if token != cached_token:
+            headers = {"Authorization": f"Bearer {token}"}
+            self._auth_header = (token, headers)
+        return headers
 
     def _make_request(
-        self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, retries: int = 3
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        retries: int = 3,
+        validator_ttl: Optional[int] = None,
     ) -> Any:
         """Make HTTP request with retries and error handling."""
         url = f"{self.base_url}{endpoint}"
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Conditional requests only for GETs whose caller asked for them
+        ttl = validator_ttl or 0
+        validators = self._validated if method == "GET" and ttl > 0 else None
+        validator_key = validators.generate_key(url, params) if validators is not None else ""
 
         for attempt in range(retries):
             try:
                 # Acquire rate limit permission
                 self.rate_limiter.acquire()
 
-                # Get valid token
-                token = self.authenticator.get_token()
-
-                # Make request
-                headers = {"Authorization": f"Bearer {token}"}
-                logger.debug(f"{method} {url} params={params}")
+                # Make request with a valid token
+                headers = self._auth_headers()
+                validated = validators.get(validator_key) if validators is not None else None
+                if validated is not None:
+                    headers = {**headers, **validated[0]}
+                if debug:
+                    logger.debug(f"{method} {url} params={params}")
 
+                start = time.monotonic()
                 response = self.session.request(
                     method, url, headers=headers, params=params, timeout=self.timeout
                 )
-
-                return self._handle_response(response)
+                if debug:
+                    latency = time.monotonic() - start
+                    logger.debug(f"Response: {response.status_code} in {latency:.2f}s")
+                self.rate_limiter.update_from_headers(response.headers)
+
+                if response.status_code == 304 and validators is not None and validated is not None:
+                    # Unchanged since the last fetch; reuse the decoded body
+                    validators.set(validator_key, validated, ttl)
+                    return validated[1]
+
+                data = self._handle_response(response, endpoint)
+                if validators is not None:
+                    self._remember_validators(validators, validator_key, response, data, ttl)
+                return data
 
             except RateLimitError as e:
                 if attempt < retries - 1:
@@ -80,13 +167,31 @@ class HTTPClient:
 
         raise ServerError("Max retries exceeded")
 
-    def _handle_response(self, response: requests.Response) -> Any:
-        """Handle HTTP response and errors."""
-        logger.debug(f"Response: {response.status_code} in {response.elapsed.total_seconds():.2f}s")
-
+    @staticmethod
+    def _remember_validators(
+        validators: ResponseCache, key: str, response: requests.Response, data: Any, ttl: int
+    ) -> None:
+        """Keep the body with its ETag / Last-Modified so the next GET can be conditional."""
+        conditional = {}
+        etag = response.headers.get("ETag")
+        if etag:
+            conditional["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        if conditional:
+            validators.set(key, (conditional, data), ttl)
+
+    def _handle_response(self, response: requests.Response, endpoint: Optional[str] = None) -> Any:
+        """
+        Handle HTTP response and errors.
+
+        404s are classified from ``endpoint`` when given, since ``response.url``
+        may have been rewritten by a proxy or redirect.
+        """
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = loads(response.content)
                 # Handle nested response structure with "data" wrapper
                 if isinstance(data, dict) and "data" in data:
                     return data["data"]
@@ -106,7 +211,8 @@ class HTTPClient:
 
         elif response.status_code == 404:
             # Check if this is a batch-related endpoint
-            if "/fuel-prices/" in response.url or "/pfs/" in response.url:
+            path = endpoint if endpoint is not None else urlsplit(response.url).path
+            if _BATCH_PATH_RE.search(path):
                 raise BatchNotFoundError(f"Batch not found: {response.url}")
             raise NotFoundError(f"Resource not found: {response.url}")
 
@@ -0,0 +1,28 @@
+"""
+JSON encoding and decoding for UK Fuel Finder API client.
+
+Uses orjson when installed (``pip install ukfuelfinder[fast]``) and falls
+back to the standard library otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document, raising ValueError if it is invalid."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object as compact UTF-8 JSON, matching orjson's output."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -2,23 +2,58 @@
 Data models for UK Fuel Finder API responses.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, TypeVar
 
 from dateutil import parser
 
 DEPRECATED_FIELDS = {"success", "message"}
 
 
+class _HasNodeId(Protocol):
+    node_id: str
+
+
+R = TypeVar("R", bound=_HasNodeId)
+
+# Slotted dataclasses (3.10+) drop the per-instance __dict__, which adds up
+# across the thousands of records in a full fetch
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a timestamp string, caching the result since a response has few distinct values."""
+    # The API sends ISO-8601, which the C parser handles; dateutil covers anything else
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
+def index_by_node_id(records: Sequence[R]) -> Dict[str, R]:
+    """Map node IDs to records; the first record wins, as with a linear scan."""
+    return {record.node_id: record for record in reversed(records)}
+
+
+def _intern(value: Any) -> Any:
+    """Intern a low-cardinality string so records repeating it share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _validate_no_deprecated_fields(data: Dict[str, Any]) -> None:
     """Validate that response data doesn't contain deprecated fields."""
-    found = DEPRECATED_FIELDS.intersection(data.keys())
-    if found:
-        raise ValueError(f"Response contains deprecated fields: {', '.join(found)}")
+    # Common case: no deprecated fields, checked without building a set
+    if DEPRECATED_FIELDS.isdisjoint(data):
+        return
+    found = sorted(DEPRECATED_FIELDS.intersection(data))
+    raise ValueError(f"Response contains deprecated fields: {', '.join(found)}")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FuelPrice:
     """Fuel price information."""
 
@@ -27,35 +62,35 @@ class FuelPrice:
     price_last_updated: Optional[datetime] = None
     price_change_effective_timestamp: Optional[datetime] = None
 
+    @classmethod
+    def from_list(cls, items: Iterable[Dict[str, Any]]) -> List["FuelPrice"]:
+        """Create a list of FuelPrice from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FuelPrice":
         """Create FuelPrice from API response dictionary."""
         _validate_no_deprecated_fields(data)
 
-        price = None
-        if data.get("price"):
-            # Price comes as string like "0120.0000"
-            price = float(data["price"])
+        # Price comes as string like "0120.0000"
+        price_str = data.get("price")
+        price = float(price_str) if price_str else None
 
-        price_last_updated = None
-        if data.get("price_last_updated"):
-            price_last_updated = parser.parse(data["price_last_updated"])
+        last_updated = data.get("price_last_updated")
+        price_last_updated = _parse_timestamp(last_updated) if last_updated else None
 
-        price_change_effective_timestamp = None
-        if data.get("price_change_effective_timestamp"):
-            price_change_effective_timestamp = parser.parse(
-                data["price_change_effective_timestamp"]
-            )
+        effective = data.get("price_change_effective_timestamp")
+        price_change_effective_timestamp = _parse_timestamp(effective) if effective else None
 
         return cls(
-            fuel_type=data["fuel_type"],
+            fuel_type=_intern(data["fuel_type"]),
             price=price,
             price_last_updated=price_last_updated,
             price_change_effective_timestamp=price_change_effective_timestamp,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PFS:
     """Petrol Filling Station with fuel prices."""
 
@@ -65,22 +100,27 @@ class PFS:
     public_phone_number: Optional[str]
     fuel_prices: List[FuelPrice]
 
+    @classmethod
+    def from_list(cls, items: Iterable[Dict[str, Any]]) -> List["PFS"]:
+        """Create a list of PFS from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PFS":
         """Create PFS from API response dictionary."""
         _validate_no_deprecated_fields(data)
 
-        fuel_prices = [FuelPrice.from_dict(fp) for fp in data.get("fuel_prices", [])]
+        fuel_prices = FuelPrice.from_list(data.get("fuel_prices", ()))
         return cls(
             node_id=data["node_id"],
-            mft_organisation_name=data.get("mft_organisation_name"),
+            mft_organisation_name=_intern(data.get("mft_organisation_name")),
             trading_name=data["trading_name"],
             public_phone_number=data.get("public_phone_number"),
             fuel_prices=fuel_prices,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Address:
     """Station address information."""
 
@@ -99,14 +139,14 @@ class Address:
         return cls(
             address_line_1=data["address_line_1"],
             address_line_2=data.get("address_line_2"),
-            city=data["city"],
-            country=data["country"],
-            county=data.get("county"),
+            city=_intern(data["city"]),
+            country=_intern(data["country"]),
+            county=_intern(data.get("county")),
             postcode=data["postcode"],
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Location:
     """Geographic coordinates."""
 
@@ -132,14 +172,14 @@ class Location:
             longitude=longitude,
             address_line_1=data.get("address_line_1"),
             address_line_2=data.get("address_line_2"),
-            city=data.get("city"),
-            country=data.get("country"),
-            county=data.get("county"),
+            city=_intern(data.get("city")),
+            country=_intern(data.get("country")),
+            county=_intern(data.get("county")),
             postcode=data.get("postcode"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PFSInfo:
     """Petrol Filling Station information (without prices)."""
 
@@ -159,6 +199,11 @@ class PFSInfo:
     opening_times: Optional[Dict[str, Any]] = None
     fuel_types: Optional[List[str]] = None
 
+    @classmethod
+    def from_list(cls, items: Iterable[Dict[str, Any]]) -> List["PFSInfo"]:
+        """Create a list of PFSInfo from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PFSInfo":
         """Create PFSInfo from API response dictionary."""
@@ -168,11 +213,11 @@ class PFSInfo:
 
         return cls(
             node_id=data["node_id"],
-            mft_organisation_name=data.get("mft_organisation_name"),
+            mft_organisation_name=_intern(data.get("mft_organisation_name")),
             trading_name=data["trading_name"],
             public_phone_number=data.get("public_phone_number"),
             is_same_trading_and_brand_name=data.get("is_same_trading_and_brand_name"),
-            brand_name=data.get("brand_name"),
+            brand_name=_intern(data.get("brand_name")),
             temporary_closure=data.get("temporary_closure"),
             permanent_closure=data.get("permanent_closure"),
             permanent_closure_date=data.get("permanent_closure_date"),
@@ -183,3 +228,28 @@ class PFSInfo:
             opening_times=data.get("opening_times"),
             fuel_types=data.get("fuel_types"),
         )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Overview:
+    """All PFS fuel prices from a single fetch, indexed by fuel type."""
+
+    pfs: List[Any]  # PFS, or BackwardCompatibleResponse-wrapped PFS
+    by_fuel_type: Dict[str, List[FuelPrice]] = field(default_factory=dict)
+
+    @classmethod
+    def from_pfs_list(
+        cls, pfs_list: List[Any], fuel_types: Optional[Iterable[str]] = None
+    ) -> "Overview":
+        """
+        Create Overview from a list of PFS, grouping prices in one pass.
+
+        If fuel_types is given, only those fuel types are indexed.
+        """
+        wanted = set(fuel_types) if fuel_types is not None else None
+        by_fuel_type: Dict[str, List[FuelPrice]] = {}
+        for pfs in pfs_list:
+            for price in pfs.fuel_prices:
+                if wanted is None or price.fuel_type in wanted:
+                    by_fuel_type.setdefault(price.fuel_type, []).append(price)
+        return cls(pfs=pfs_list, by_fuel_type=by_fuel_type)
@@ -5,45 +5,85 @@ Rate limiting for UK Fuel Finder API client.
 import threading
 import time
 from collections import deque
-from typing import Deque
+from typing import Deque, Mapping, Optional
 
 from .exceptions import RateLimitError
 
 
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer header value, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
 class RateLimiter:
-    """Rate limiter with sliding window and exponential backoff."""
+    """
+    Rate limiter with sliding window and exponential backoff.
+
+    All internal timestamps use the monotonic clock, so wall-clock
+    adjustments cannot stall or release requests early.
+    """
 
     def __init__(self, requests_per_minute: int, daily_limit: int):
         self.requests_per_minute = requests_per_minute
         self.daily_limit = daily_limit
         self._minute_window: Deque[float] = deque()
         self._daily_count = 0
-        self._daily_reset = time.time() + 86400  # 24 hours
+        self._daily_reset = time.monotonic() + 86400  # 24 hours
+        self._paused_until = 0.0
         self._lock = threading.Lock()
 
     def acquire(self) -> None:
         """Acquire permission to make a request, blocking if necessary."""
+        self.acquire_many(1)
+
+    def acquire_many(self, n: int) -> None:
+        """
+        Acquire permission for ``n`` requests at once, blocking if necessary.
+
+        A send time is reserved under the lock and the wait happens after
+        releasing it, so other threads can queue their own reservations
+        meanwhile.
+
+        Args:
+            n: Number of requests, at most ``requests_per_minute``
+        """
+        if n > self.requests_per_minute:
+            raise ValueError(
+                f"Cannot acquire {n} requests with a limit of {self.requests_per_minute} per minute"
+            )
         with self._lock:
             self._reset_daily_if_needed()
-            self._wait_if_needed()
-            self._record_request()
+            start = self._reserve(n)
+
+        wait_time = start - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     def _reset_daily_if_needed(self) -> None:
         """Reset daily counter if 24 hours have passed."""
-        if time.time() >= self._daily_reset:
+        if time.monotonic() >= self._daily_reset:
             self._daily_count = 0
-            self._daily_reset = time.time() + 86400
+            self._daily_reset = time.monotonic() + 86400
+
+    def _reserve(self, n: int) -> float:
+        """Record ``n`` requests and return when they may be sent. Caller must hold the lock."""
+        now = time.monotonic()
 
-    def _wait_if_needed(self) -> None:
-        """Wait if rate limits would be exceeded."""
-        now = time.time()
+        # Honour a pause requested by the server's rate limit headers
+        start = max(now, self._paused_until)
 
         # Remove requests older than 1 minute
         while self._minute_window and self._minute_window[0] < now - 60:
             self._minute_window.popleft()
 
         # Check daily limit
-        if self._daily_count >= self.daily_limit:
+        if self._daily_count + n > self.daily_limit:
             wait_time = self._daily_reset - now
             raise RateLimitError(
                 f"Daily limit of {self.daily_limit} requests exceeded. "
@@ -51,18 +91,53 @@ class RateLimiter:
                 retry_after=int(wait_time),
             )
 
-        # Check per-minute limit
-        if len(self._minute_window) >= self.requests_per_minute:
-            oldest = self._minute_window[0]
-            wait_time = 60 - (now - oldest)
-            if wait_time > 0:
-                time.sleep(wait_time)
-
-    def _record_request(self) -> None:
-        """Record a request in the sliding window."""
-        now = time.time()
-        self._minute_window.append(now)
-        self._daily_count += 1
+        # Check per-minute limit, waiting until enough requests leave the window.
+        # The window holds reserved send times, which may be in the future.
+        excess = len(self._minute_window) + n - self.requests_per_minute
+        if excess > 0:
+            start = max(start, self._minute_window[excess - 1] + 60)
+
+        self._minute_window.extend([start] * n)
+        self._daily_count += n
+        return start
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Pause further requests when the server reports its quota is nearly used.
+
+        Reads ``X-RateLimit-Remaining`` (and ``X-RateLimit-Limit`` /
+        ``X-RateLimit-Reset`` when present) so the client slows down before the
+        server starts returning 429 responses.
+
+        Args:
+            headers: Response headers from the API
+        """
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        limit = _int_header(headers, "X-RateLimit-Limit") or self.requests_per_minute
+        if remaining > max(2, limit // 10):
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            reset = _int_header(headers, "X-RateLimit-Reset")
+            if reset is None:
+                # Wait for the oldest request to leave the sliding window
+                oldest = self._minute_window[0] if self._minute_window else now
+                wait_time = 60 - (now - oldest)
+            elif reset > time.time():
+                # Reset given as an epoch timestamp, the only wall-clock value used
+                wait_time = reset - time.time()
+            else:
+                # Reset given as seconds until the window resets
+                wait_time = reset
+
+            if remaining > 0:
+                # Spread the remaining requests over the wait
+                wait_time /= remaining + 1
+            self._paused_until = max(self._paused_until, now + wait_time)
 
     def handle_rate_limit_error(self, retry_after: int) -> None:
         """Handle 429 rate limit error with exponential backoff."""
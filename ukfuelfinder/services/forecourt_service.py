@@ -2,11 +2,12 @@
 Forecourt service for UK Fuel Finder API.
 """
 
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
 
 from ..cache import ResponseCache
 from ..http_client import HTTPClient
 from ..models import PFSInfo
+from .pagination import iter_batches
 
 
 class ForecourtService:
@@ -16,6 +17,9 @@ class ForecourtService:
         self.http_client = http_client
         self.cache = cache
         self.cache_ttl = 3600  # 1 hour for forecourt info
+        self.max_workers = 4  # Concurrent batch requests during pagination
+        # Parsed models per cache key, paired with the raw response they came from
+        self._parsed = ResponseCache(maxsize=64)
 
     def get_all_pfs(
         self, batch_number: Optional[int] = None, use_cache: bool = True
@@ -28,7 +32,8 @@ class ForecourtService:
             use_cache: Whether to use cached response
 
         Returns:
-            List of PFS information
+            List of PFS information; a new list whose models are shared with
+            other calls while the response is cached
         """
         params: Dict[str, Any] = {}
         if batch_number:
@@ -39,12 +44,12 @@ class ForecourtService:
         if use_cache:
             cached = self.cache.get(cache_key)
             if cached is not None:
-                return [PFSInfo.from_dict(item) for item in cached]
+                return self._from_cached(cache_key, cached)
 
-        response = self.http_client.get("/pfs", params=params)
+        response = self.http_client.get("/pfs", params=params, validator_ttl=2 * self.cache_ttl)
         self.cache.set(cache_key, response, self.cache_ttl)
 
-        return [PFSInfo.from_dict(item) for item in response]
+        return self._from_cached(cache_key, response)
 
     def get_incremental_pfs(
         self,
@@ -61,7 +66,8 @@ class ForecourtService:
             use_cache: Whether to use cached response
 
         Returns:
-            List of updated PFS information
+            List of updated PFS information; a new list whose models are shared with
+            other calls while the response is cached
         """
         params: Dict[str, Any] = {"effective-start-timestamp": effective_start_timestamp}
         if batch_number:
@@ -72,15 +78,44 @@ class ForecourtService:
         if use_cache:
             cached = self.cache.get(cache_key)
             if cached is not None:
-                return [PFSInfo.from_dict(item) for item in cached]
+                return self._from_cached(cache_key, cached)
 
-        response = self.http_client.get("/pfs", params=params)
+        response = self.http_client.get("/pfs", params=params, validator_ttl=2 * self.cache_ttl)
         self.cache.set(cache_key, response, self.cache_ttl)
 
-        return [PFSInfo.from_dict(item) for item in response]
+        return self._from_cached(cache_key, response)
 
-    def get_pfs_by_node_id(self, node_id: str, pfs_list: List[PFSInfo]) -> Optional[PFSInfo]:
-        """Get specific PFS by node ID from a list."""
+    def clear_cache(self) -> None:
+        """Clear cached responses and the models parsed from them."""
+        self.cache.clear()
+        self._parsed.clear()
+
+    def _from_cached(self, cache_key: str, response: List[Dict[str, Any]]) -> List[PFSInfo]:
+        """
+        Parse a response, reusing the models already built from the same cached object.
+
+        Each call returns a new list, but the model objects in it are shared
+        between calls for the same response.
+        """
+        entry = self._parsed.get(cache_key)
+        if entry is not None and entry[0] is response:
+            return list(entry[1])
+        result = PFSInfo.from_list(response)
+        # Outlive the raw entry, so a body revalidated by a 304 is not parsed again
+        self._parsed.set(cache_key, (response, result), 2 * self.cache_ttl)
+        return list(result)
+
+    def get_pfs_by_node_id(
+        self, node_id: str, pfs_list: Union[List[PFSInfo], Mapping[str, PFSInfo]]
+    ) -> Optional[PFSInfo]:
+        """
+        Get specific PFS by node ID from a list.
+
+        For repeated lookups, pass the mapping from ``index_by_node_id`` instead
+        of the list to avoid a scan per call.
+        """
+        if isinstance(pfs_list, Mapping):
+            return pfs_list.get(node_id)
         for pfs in pfs_list:
             if pfs.node_id == node_id:
                 return pfs
@@ -91,6 +126,7 @@ class ForecourtService:
         Get all PFS information with automatic pagination.
 
         Yields batches of up to 500 PFS records until no more data is available.
+        Up to ``max_workers`` batches are fetched concurrently.
 
         Args:
             use_cache: Whether to use cached responses
@@ -98,12 +134,7 @@ class ForecourtService:
         Yields:
             Lists of PFS information (up to 500 per batch)
         """
-        batch = 1
-        while True:
-            pfs_list = self.get_all_pfs(batch_number=batch, use_cache=use_cache)
-            if not pfs_list:
-                break
-            yield pfs_list
-            if len(pfs_list) < 500:
-                break
-            batch += 1
+        yield from iter_batches(
+            lambda batch: self.get_all_pfs(batch_number=batch, use_cache=use_cache),
+            max_workers=self.max_workers,
+        )
@@ -0,0 +1,70 @@
+"""
+Batch pagination for UK Fuel Finder API services.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterator, List, TypeVar
+
+from ..exceptions import BatchNotFoundError
+
+T = TypeVar("T")
+
+BATCH_SIZE = 500
+
+
+def _fetch_or_end(fetch_batch: Callable[[int], List[T]], batch_number: int) -> List[T]:
+    """Fetch a batch, treating a 404 past the first batch as the end of the data."""
+    try:
+        return fetch_batch(batch_number)
+    except BatchNotFoundError:
+        if batch_number == 1:
+            raise
+        return []
+
+
+def iter_batches(fetch_batch: Callable[[int], List[T]], max_workers: int = 1) -> Iterator[List[T]]:
+    """
+    Yield batches in order until the API runs out of data.
+
+    The API does not report how many batches exist, so with ``max_workers > 1``
+    the following batches are requested ahead of the one being consumed.
+    Requests that turn out to be past the final batch are discarded.
+
+    Args:
+        fetch_batch: Callable returning the records for a batch number
+        max_workers: Maximum number of batch requests in flight
+
+    Yields:
+        Lists of records (up to 500 per batch)
+    """
+    if max_workers <= 1:
+        batch = 1
+        while True:
+            records = _fetch_or_end(fetch_batch, batch)
+            if not records:
+                return
+            yield records
+            if len(records) < BATCH_SIZE:
+                return
+            batch += 1
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: Deque["Future[List[T]]"] = deque()
+    next_batch = 1
+    try:
+        while True:
+            while len(pending) < max_workers:
+                pending.append(executor.submit(_fetch_or_end, fetch_batch, next_batch))
+                next_batch += 1
+
+            records = pending.popleft().result()
+            if not records:
+                return
+            yield records
+            if len(records) < BATCH_SIZE:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
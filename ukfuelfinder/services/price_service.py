@@ -2,11 +2,12 @@
 Price service for UK Fuel Finder API.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from ..cache import ResponseCache
 from ..http_client import HTTPClient
 from ..models import PFS, FuelPrice
+from .pagination import iter_batches
 
 
 class PriceService:
@@ -16,6 +17,9 @@ class PriceService:
         self.http_client = http_client
         self.cache = cache
         self.cache_ttl = 900  # 15 minutes for prices
+        self.max_workers = 4  # Concurrent batch requests during pagination
+        # Parsed models per cache key, paired with the raw response they came from
+        self._parsed = ResponseCache(maxsize=64)
 
     def get_all_pfs_prices(
         self,
@@ -32,7 +36,8 @@ class PriceService:
             use_cache: Whether to use cached response
 
         Returns:
-            List of PFS with fuel prices
+            List of PFS with fuel prices; a new list whose models are shared with
+            other calls while the response is cached
         """
         params: Dict[str, Any] = {}
         if batch_number:
@@ -45,15 +50,46 @@ class PriceService:
         if use_cache:
             cached = self.cache.get(cache_key)
             if cached is not None:
-                return [PFS.from_dict(item) for item in cached]
+                return self._from_cached(cache_key, cached)
 
-        response = self.http_client.get("/pfs/fuel-prices", params=params)
+        response = self.http_client.get(
+            "/pfs/fuel-prices", params=params, validator_ttl=2 * self.cache_ttl
+        )
         self.cache.set(cache_key, response, self.cache_ttl)
 
-        return [PFS.from_dict(item) for item in response]
+        return self._from_cached(cache_key, response)
 
-    def get_pfs_by_node_id(self, node_id: str, pfs_list: List[PFS]) -> Optional[PFS]:
-        """Get specific PFS by node ID from a list."""
+    def clear_cache(self) -> None:
+        """Clear cached responses and the models parsed from them."""
+        self.cache.clear()
+        self._parsed.clear()
+
+    def _from_cached(self, cache_key: str, response: List[Dict[str, Any]]) -> List[PFS]:
+        """
+        Parse a response, reusing the models already built from the same cached object.
+
+        Each call returns a new list, but the model objects in it are shared
+        between calls for the same response.
+        """
+        entry = self._parsed.get(cache_key)
+        if entry is not None and entry[0] is response:
+            return list(entry[1])
+        result = PFS.from_list(response)
+        # Outlive the raw entry, so a body revalidated by a 304 is not parsed again
+        self._parsed.set(cache_key, (response, result), 2 * self.cache_ttl)
+        return list(result)
+
+    def get_pfs_by_node_id(
+        self, node_id: str, pfs_list: Union[List[PFS], Mapping[str, PFS]]
+    ) -> Optional[PFS]:
+        """
+        Get specific PFS by node ID from a list.
+
+        For repeated lookups, pass the mapping from ``index_by_node_id`` instead
+        of the list to avoid a scan per call.
+        """
+        if isinstance(pfs_list, Mapping):
+            return pfs_list.get(node_id)
         for pfs in pfs_list:
             if pfs.node_id == node_id:
                 return pfs
@@ -79,6 +115,8 @@ class PriceService:
         """
         Get all PFS fuel prices with automatic pagination.
 
+        Up to ``max_workers`` batches are fetched concurrently.
+
         Args:
             effective_start_timestamp: Timestamp for incremental updates
             use_cache: Whether to use cached responses
@@ -86,18 +124,14 @@ class PriceService:
         Returns:
             Complete list of all PFS with fuel prices
         """
-        all_pfs = []
-        batch = 1
-        while True:
-            pfs_list = self.get_all_pfs_prices(
+        all_pfs: List[PFS] = []
+        for pfs_list in iter_batches(
+            lambda batch: self.get_all_pfs_prices(
                 batch_number=batch,
                 effective_start_timestamp=effective_start_timestamp,
                 use_cache=use_cache,
-            )
-            if not pfs_list:
-                break
+            ),
+            max_workers=self.max_workers,
+        ):
             all_pfs.extend(pfs_list)
-            if len(pfs_list) < 500:
-                break
-            batch += 1
         return all_pfs